@@ -1,50 +1,91 @@
 """
 API Utilities Module
 Provides FastAPI application initialization, route handlers, and utility functions
+
+Exports are resolved lazily (PEP 562) so that importing a light submodule such
+as ``api_utils.server_state`` does not load the app, the routers and the STREAM
+proxy. FastAPI and Playwright still come in through the eager queue_worker
+import below.
 """
 
-# Application initialization
-from .app import create_app
+import importlib
+from typing import TYPE_CHECKING, Any
 
 # Queue worker
+# Eager on purpose: the export shares its name with the submodule, and once
+# ``api_utils.queue_worker`` is imported the module object would shadow a
+# lazily resolved function.
 from .queue_worker import queue_worker
 
-# Request processor
-from .request_processor import (
-    _process_request_refactored,  # pyright: ignore[reportPrivateUsage]
-)
+if TYPE_CHECKING:
+    # Static view of the lazy exports below, so type checkers see real types
+    from .app import create_app
+    from .request_processor import _process_request_refactored
+    from .routers import (
+        cancel_request,
+        chat_completions,
+        get_api_info,
+        get_queue_status,
+        health_check,
+        list_models,
+        read_index,
+        websocket_log_endpoint,
+    )
+    from .sse import (
+        generate_sse_chunk,
+        generate_sse_error_chunk,
+        generate_sse_stop_chunk,
+    )
+    from .utils import prepare_combined_prompt
+    from .utils_ext.helper import use_helper_get_response
+    from .utils_ext.stream import clear_stream_queue, use_stream_response
+    from .utils_ext.tokens import calculate_usage_stats, estimate_tokens
+    from .utils_ext.validation import validate_chat_request
 
-# Route handlers (aggregated from routers)
-from .routers import (
-    cancel_request,
-    chat_completions,
-    get_api_info,
-    get_queue_status,
-    health_check,
-    list_models,
-    read_index,
-    websocket_log_endpoint,
-)
-from .sse import (
-    generate_sse_chunk,
-    generate_sse_error_chunk,
-    generate_sse_stop_chunk,
-)
+# Exported name -> submodule that defines it
+_LAZY_ATTRS = {
+    # Application initialization
+    "create_app": ".app",
+    # Request processor
+    "_process_request_refactored": ".request_processor",
+    # Route handlers (aggregated from routers)
+    "cancel_request": ".routers",
+    "chat_completions": ".routers",
+    "get_api_info": ".routers",
+    "get_queue_status": ".routers",
+    "health_check": ".routers",
+    "list_models": ".routers",
+    "read_index": ".routers",
+    "websocket_log_endpoint": ".routers",
+    "generate_sse_chunk": ".sse",
+    "generate_sse_error_chunk": ".sse",
+    "generate_sse_stop_chunk": ".sse",
+    # Utility functions
+    "prepare_combined_prompt": ".utils",
+    "use_helper_get_response": ".utils_ext.helper",
+    "clear_stream_queue": ".utils_ext.stream",
+    "use_stream_response": ".utils_ext.stream",
+    "calculate_usage_stats": ".utils_ext.tokens",
+    "estimate_tokens": ".utils_ext.tokens",
+    "validate_chat_request": ".utils_ext.validation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
-# Utility functions
-from .utils import prepare_combined_prompt
-from .utils_ext.helper import use_helper_get_response
-from .utils_ext.stream import (
-    clear_stream_queue,
-    use_stream_response,
-)
-from .utils_ext.tokens import (
-    calculate_usage_stats,
-    estimate_tokens,
-)
-from .utils_ext.validation import validate_chat_request
 
-__all__ = [
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+__all__ = (
     # Application initialization
     "create_app",
     # Route handlers
@@ -71,4 +112,4 @@ __all__ = [
     "_process_request_refactored",
     # Queue worker
     "queue_worker",
-]
+)
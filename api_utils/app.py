@@ -8,9 +8,11 @@ import queue
 import sys
 import time
 from asyncio import Lock, Queue
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Awaitable, Callable
+from typing import Any, Awaitable, Callable
 
+import anyio.to_thread
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -29,7 +31,12 @@ from browser_utils import (
 )
 
 # --- Configuration imports ---
-from config import EXCLUDED_MODELS_FILENAME, NO_PROXY_ENV, get_environment_variable
+from config import (
+    EXCLUDED_MODELS_FILENAME,
+    NO_PROXY_ENV,
+    THREADPOOL_MAX_WORKERS,
+    get_environment_variable,
+)
 
 # --- logging_utils module imports ---
 from logging_utils import restore_original_streams, setup_server_logging
@@ -38,6 +45,7 @@ from logging_utils import restore_original_streams, setup_server_logging
 from models import WebSocketConnectionManager
 
 from . import auth_utils
+from .client_connection import cancel_all_disconnect_tasks
 
 VERSION = "0.1.0"
 
@@ -76,6 +84,19 @@ def _initialize_globals():
     state.logger.info("API keys and global locks initialized.")
 
 
+def _configure_thread_pools():
+    """Raise the worker thread limits so blocking calls don't queue up behind each other"""
+    # Starlette/FastAPI threadpool (sync dependencies, file responses)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        THREADPOOL_MAX_WORKERS
+    )
+    # asyncio.to_thread / run_in_executor(None, ...) used by the startup and
+    # stream code; some of those calls park a thread for the whole run
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=THREADPOOL_MAX_WORKERS)
+    )
+
+
 def _initialize_proxy_settings():
     stream_port_env = get_environment_variable("STREAM_PORT")
     if stream_port_env == "0":
@@ -133,7 +154,7 @@ async def _start_stream_proxy():
             raise RuntimeError("STREAM proxy failed to start in time.")
 
 
-async def _initialize_browser_and_page():
+async def _start_playwright():
     from playwright.async_api import async_playwright
 
     state.logger.info("Starting Playwright...")
@@ -141,6 +162,26 @@ async def _initialize_browser_and_page():
     state.is_playwright_ready = True
     state.logger.info("Playwright started.")
 
+
+async def _start_stream_proxy_and_playwright():
+    """Start the STREAM proxy and the Playwright driver concurrently.
+
+    Neither depends on the other; only connecting to the browser needs both.
+    Both branches are allowed to finish before the first error is re-raised,
+    so shutdown never races a half-started Playwright driver.
+    """
+    results = await asyncio.gather(
+        _start_stream_proxy(), _start_playwright(), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def _initialize_browser_and_page():
+    if state.playwright_manager is None:
+        await _start_playwright()
+
     ws_endpoint = get_environment_variable("CAMOUFOX_WS_ENDPOINT")
     launch_mode = get_environment_variable("LAUNCH_MODE", "unknown")
 
@@ -172,23 +213,8 @@ async def _initialize_browser_and_page():
         state.model_list_fetch_event.set()
 
 
-async def _shutdown_resources():
+def _stop_stream_proxy():
     logger = state.logger
-    logger.info("Shutting down resources...")
-
-    # Signal global shutdown if event exists
-    try:
-        from config import GlobalState
-
-        if hasattr(GlobalState, "IS_SHUTTING_DOWN") and hasattr(
-            GlobalState.IS_SHUTTING_DOWN, "set"
-        ):
-            GlobalState.IS_SHUTTING_DOWN.set()
-    except Exception as e:
-        logger.debug(f"Failed to set IS_SHUTTING_DOWN: {e}")
-
-    state.should_exit = True
-
     if state.STREAM_PROCESS:
         try:
             state.STREAM_PROCESS.terminate()
@@ -210,6 +236,49 @@ async def _shutdown_resources():
             state.STREAM_QUEUE = None
             logger.info("STREAM proxy terminated.")
 
+
+# How long a cancelled teardown stage waits for its shielded close call
+# before moving on to the next stage.
+_SHIELDED_CLOSE_GRACE_SECONDS = 5.0
+
+# Upper bound on browser.close(); a stalled browser connection must not hang
+# shutdown before Playwright is stopped.
+_BROWSER_CLOSE_TIMEOUT_SECONDS = 5.0
+
+
+def _consume_task_result(task: "asyncio.Future[Any]") -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+async def _shielded_close(aw: Awaitable[Any]) -> None:
+    """Await a close call that survives cancellation of the caller.
+
+    On cancellation, waits (bounded) for the call to finish before re-raising,
+    so the next teardown stage never overlaps a close still in flight. A late
+    failure is consumed instead of surfacing as "exception never retrieved".
+    """
+    task = asyncio.ensure_future(aw)
+    try:
+        await asyncio.shield(task)
+    except asyncio.CancelledError:
+        try:
+            await asyncio.wait({task}, timeout=_SHIELDED_CLOSE_GRACE_SECONDS)
+        finally:
+            if task.done():
+                _consume_task_result(task)
+            else:
+                task.add_done_callback(_consume_task_result)
+        raise
+
+
+async def _close_browser_resources():
+    # Close calls are shielded: a second Ctrl+C cancels the wait, not the
+    # Playwright call itself, so the browser is not left behind as a zombie.
+    # Each stage still finishes (or times out) before the next one starts,
+    # keeping the page -> browser -> Playwright order.
+    logger = state.logger
+
     if state.worker_task and not state.worker_task.done():
         logger.info("Cancelling worker task...")
         state.worker_task.cancel()
@@ -225,9 +294,12 @@ async def _shutdown_resources():
         finally:
             state.worker_task = None
 
+    # Requests interrupted mid-flight may not have reached their own cleanup
+    await cancel_all_disconnect_tasks()
+
     if state.page_instance:
         try:
-            await _close_page_logic()
+            await _shielded_close(_close_page_logic())
         except asyncio.CancelledError:
             logger.debug("Page closure cancelled (CancelledError).")
         except Exception as e:
@@ -239,10 +311,19 @@ async def _shutdown_resources():
     if state.browser_instance:
         try:
             if state.browser_instance.is_connected():
-                await state.browser_instance.close()
+                await _shielded_close(
+                    asyncio.wait_for(
+                        state.browser_instance.close(),
+                        timeout=_BROWSER_CLOSE_TIMEOUT_SECONDS,
+                    )
+                )
                 logger.info("Browser connection closed.")
         except asyncio.CancelledError:
             logger.debug("Browser closure cancelled (CancelledError).")
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Browser close timed out after {_BROWSER_CLOSE_TIMEOUT_SECONDS}s, continuing shutdown."
+            )
         except Exception as e:
             logger.error(f"Error during browser closure: {e}")
         finally:
@@ -251,7 +332,7 @@ async def _shutdown_resources():
 
     if state.playwright_manager:
         try:
-            await state.playwright_manager.stop()
+            await _shielded_close(state.playwright_manager.stop())
             logger.info("Playwright stopped.")
         except asyncio.CancelledError:
             logger.debug("Playwright stop cancelled (CancelledError).")
@@ -262,6 +343,32 @@ async def _shutdown_resources():
             state.is_playwright_ready = False
 
 
+async def _shutdown_resources():
+    logger = state.logger
+    logger.info("Shutting down resources...")
+
+    # Signal global shutdown if event exists
+    try:
+        from config import GlobalState
+
+        if hasattr(GlobalState, "IS_SHUTTING_DOWN") and hasattr(
+            GlobalState.IS_SHUTTING_DOWN, "set"
+        ):
+            GlobalState.IS_SHUTTING_DOWN.set()
+    except Exception as e:
+        logger.debug(f"Failed to set IS_SHUTTING_DOWN: {e}")
+
+    state.should_exit = True
+
+    # The STREAM proxy is independent of the worker -> page -> browser ->
+    # Playwright chain, so its (blocking) terminate/join runs in a thread
+    # while that chain is torn down in order.
+    await asyncio.gather(
+        asyncio.to_thread(_stop_stream_proxy),
+        _close_browser_resources(),
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI application lifecycle management"""
@@ -272,6 +379,7 @@ async def lifespan(app: FastAPI):
     logger = state.logger
 
     _initialize_globals()
+    _configure_thread_pools()
     _initialize_proxy_settings()
     load_excluded_models(EXCLUDED_MODELS_FILENAME)
 
@@ -280,7 +388,7 @@ async def lifespan(app: FastAPI):
     logger.info("Starting AI Studio Proxy Server...")
 
     try:
-        await _start_stream_proxy()
+        await _start_stream_proxy_and_playwright()
         await _initialize_browser_and_page()
 
         launch_mode = get_environment_variable("LAUNCH_MODE", "unknown")
@@ -320,6 +428,15 @@ async def lifespan(app: FastAPI):
     finally:
         logger.info("Shutting down server...")
 
+        # Cancel the watchdog first so it unwinds while cookies are being
+        # saved (and cannot start a rotation mid-save); awaited below.
+        watchdog_task = None
+        if hasattr(app.state, "watchdog_task"):
+            logger.info("[STOP] Stopping Quota Watchdog...")
+            watchdog_task = app.state.watchdog_task
+            if hasattr(watchdog_task, "cancel"):
+                watchdog_task.cancel()
+
         # Stop periodic cookie refresh and save cookies before shutdown
         if hasattr(app.state, "cookie_refresh_task"):
             logger.info("[STOP] Stopping Cookie Refresh Task...")
@@ -335,17 +452,12 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 logger.warning(f"[COOKIE-REFRESH] Shutdown save error: {e}")
 
-        if hasattr(app.state, "watchdog_task"):
-            logger.info("[STOP] Stopping Quota Watchdog...")
-            task = app.state.watchdog_task
-            if hasattr(task, "cancel"):
-                task.cancel()
-                # Only await if it's actually an asyncio task or future
-                if isinstance(task, (asyncio.Task, asyncio.Future)):
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
+        # Only await if it's actually an asyncio task or future
+        if isinstance(watchdog_task, (asyncio.Task, asyncio.Future)):
+            try:
+                await watchdog_task
+            except asyncio.CancelledError:
+                pass
 
         try:
             await _shutdown_resources()
@@ -1,5 +1,4 @@
 import asyncio
-import glob
 import logging
 import os
 from typing import List, Optional, Set
@@ -9,6 +8,20 @@ from launcher.config import SAVED_AUTH_DIR
 logger = logging.getLogger("AuthManager")
 
 
+def _scan_profiles(directory: str) -> List[str]:
+    """Return the sorted paths of the .json files directly inside directory."""
+    # scandir yields the entry type with the name, so unlike glob there is no
+    # extra stat per file
+    with os.scandir(directory) as entries:
+        return sorted(
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".json")
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        )
+
+
 class AuthManager:
     """
     Manages authentication profiles for rotation and error recovery.
@@ -30,10 +43,8 @@ class AuthManager:
             return []
 
         loop = asyncio.get_running_loop()
-        pattern = os.path.join(SAVED_AUTH_DIR, "*.json")
-        # Run glob in executor to avoid blocking the event loop
-        profiles = await loop.run_in_executor(None, glob.glob, pattern)
-        return sorted(profiles)  # Sort for deterministic order
+        # Run the scan in executor to avoid blocking the event loop
+        return await loop.run_in_executor(None, _scan_profiles, SAVED_AUTH_DIR)
 
     async def get_next_profile(self) -> str:
         """
@@ -1,3 +1,4 @@
+import hmac
 import os
 from typing import Set
 
@@ -17,7 +18,8 @@ def load_api_keys():
         with open(KEY_FILE_PATH, "r") as f:
             for line in f:
                 key = line.strip()
-                if key:
+                # Skip blank lines and "#" comments
+                if key and not key.startswith("#"):
                     API_KEYS.add(key)
 
 
@@ -36,4 +38,6 @@ def verify_api_key(api_key_from_header: str) -> bool:
     """
     if not API_KEYS:
         return True
-    return api_key_from_header in API_KEYS
+    # Constant-time comparison so response timing does not reveal key prefixes
+    candidate = api_key_from_header.encode("utf-8")
+    return any(hmac.compare_digest(candidate, key.encode("utf-8")) for key in API_KEYS)
@@ -1,68 +1,43 @@
 import asyncio
-from asyncio import Event, Task
-from typing import Any, Callable, Coroutine, Dict, Tuple
+import weakref
+from asyncio import Event
+from typing import Any, Callable, Tuple
 
 from fastapi import HTTPException, Request
 
 from models import ClientDisconnectedError
 
+# Seconds between is_disconnected() checks while a request is in flight
+DISCONNECT_POLL_INTERVAL = 1.0
+
+# Live disconnect pollers, so shutdown can cancel any that a request left behind
+_active_disconnect_tasks: "weakref.WeakSet[asyncio.Task]" = weakref.WeakSet()
+
 
 async def check_client_connection(req_id: str, http_request: Request) -> bool:
     """
     Checks if the client is still connected.
     Returns True if connected, False if disconnected.
     """
-    try:
-        if hasattr(http_request, "_receive"):
-            try:
-                # Use a very short timeout to check for disconnect message
-                # _receive is a private Starlette/FastAPI method that returns a coroutine
-                receive_obj = http_request  # type: ignore[misc]
-                receive_coro: Coroutine[Any, Any, Dict[str, Any]] = (
-                    receive_obj._receive()
-                )  # type: ignore[misc]
-                receive_task: Task[Dict[str, Any]] = asyncio.create_task(receive_coro)
-                done, pending = await asyncio.wait([receive_task], timeout=0.01)
-
-                if done:
-                    message = receive_task.result()
-                    if message.get("type") == "http.disconnect":
-                        return False
-                else:
-                    # Cancel the task if it didn't complete immediately
-                    receive_task.cancel()
-                    try:
-                        await receive_task
-                    except asyncio.CancelledError:
-                        pass
-                    # If it didn't complete immediately, proceed to fallback check
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                # If checking fails, proceed to fallback
-                pass
-
-        # Fallback to is_disconnected() if available (Starlette/FastAPI)
-        # Wrap in wait_for to prevent infinite hang in some ASGI implementations
-        if hasattr(http_request, "is_disconnected"):
-            try:
-                # Handle both sync and async versions for better mock compatibility
-                res = http_request.is_disconnected()
-                if asyncio.iscoroutine(res):
-                    if await asyncio.wait_for(res, timeout=0.01):
-                        return False
-                elif res:
+    # is_disconnected() is authoritative (Starlette/FastAPI); reading the
+    # private _receive() channel would steal ASGI messages from Starlette.
+    # Wrap in wait_for to prevent infinite hang in some ASGI implementations
+    if hasattr(http_request, "is_disconnected"):
+        try:
+            # Handle both sync and async versions for better mock compatibility
+            res = http_request.is_disconnected()
+            if asyncio.iscoroutine(res):
+                if await asyncio.wait_for(res, timeout=0.01):
                     return False
-            except (asyncio.TimeoutError, asyncio.CancelledError):
-                # If it times out, it's likely still connected
-                return True
+            elif res:
+                return False
+        except asyncio.TimeoutError:
+            # If it times out, it's likely still connected
+            return True
+        # CancelledError is deliberately not caught: swallowing it here would
+        # keep the calling monitor loop alive after it has been cancelled.
 
-        return True
-    except asyncio.CancelledError:
-        raise
-    except Exception as e:
-        # Re-raise to allow caller to log/handle
-        raise e
+    return True
 
 
 async def enhanced_disconnect_monitor(
@@ -89,9 +64,9 @@ async def enhanced_disconnect_monitor(
                     return True
             else:
                 disconnect_detection_count = 0
-            await asyncio.sleep(0.2)
+            await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
         except asyncio.CancelledError:
-            break
+            raise
         except Exception as e:
             logger.error(f"[{req_id}] Error in enhanced_disconnect_monitor: {e}")
             break
@@ -120,15 +95,33 @@ async def non_streaming_disconnect_monitor(
                         HTTPException(status_code=499, detail="Client disconnected")
                     )
                 return True
-            await asyncio.sleep(0.3)
+            await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
         except asyncio.CancelledError:
-            break
+            raise
         except Exception as e:
             logger.error(f"[{req_id}] Error in non_streaming_disconnect_monitor: {e}")
             break
     return False
 
 
+async def disconnect_poller(
+    http_request: Request, poll_interval: float = DISCONNECT_POLL_INTERVAL
+) -> None:
+    """
+    Returns once the client has disconnected.
+    Polls is_disconnected() every poll_interval seconds and returns on the
+    first True; intended to be raced against the real work.
+    """
+    while True:
+        # Handle both sync and async versions for better mock compatibility
+        res = http_request.is_disconnected()
+        if asyncio.iscoroutine(res):
+            res = await res
+        if res:
+            return
+        await asyncio.sleep(poll_interval)
+
+
 async def setup_disconnect_monitoring(
     req_id: str, http_request: Request, result_future
 ) -> Tuple[Event, asyncio.Task, Callable]:
@@ -137,53 +130,35 @@ async def setup_disconnect_monitoring(
     logger = state.logger
 
     client_disconnected_event = Event()
-    disconnect_count = 0
-    disconnect_threshold = 5  # Require 5 consecutive disconnect signals (1.5 seconds)
-
-    async def check_disconnect_periodically():
-        nonlocal disconnect_count
-        while not client_disconnected_event.is_set():
-            try:
-                is_connected = await check_client_connection(req_id, http_request)
-                if not is_connected:
-                    disconnect_count += 1
-                    if disconnect_count >= disconnect_threshold:
-                        logger.info(
-                            f"[{req_id}] Active detection of client disconnect (consecutive {disconnect_count} times)."
-                        )
-                        client_disconnected_event.set()
-                        if not result_future.done():
-                            result_future.set_exception(
-                                HTTPException(
-                                    status_code=499,
-                                    detail=f"[{req_id}] Client closed the request",
-                                )
-                            )
-                        break
-                    else:
-                        logger.debug(
-                            f"[{req_id}] Active detection of potential disconnect (round {disconnect_count}/{disconnect_threshold})"
-                        )
-                else:
-                    disconnect_count = 0  # Reset counter on successful connection
-
-                await asyncio.sleep(0.3)
-            except asyncio.CancelledError:
-                # Task cancelled, exit gracefully
-                break
-            except Exception as e:
-                logger.error(f"(Disco Check Task) Error: {e}")
-                client_disconnected_event.set()
-                if not result_future.done():
-                    result_future.set_exception(
-                        HTTPException(
-                            status_code=500,
-                            detail=f"[{req_id}] Internal disconnect checker error: {e}",
-                        )
+
+    def _on_poller_done(task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        client_disconnected_event.set()
+        if exc is not None:
+            logger.error(f"(Disco Check Task) Error: {exc}")
+            if not result_future.done():
+                result_future.set_exception(
+                    HTTPException(
+                        status_code=500,
+                        detail=f"[{req_id}] Internal disconnect checker error: {exc}",
                     )
-                break
+                )
+            return
+        logger.info(f"[{req_id}] Active detection of client disconnect.")
+        if not result_future.done():
+            result_future.set_exception(
+                HTTPException(
+                    status_code=499,
+                    detail=f"[{req_id}] Client closed the request",
+                )
+            )
 
-    disconnect_check_task = asyncio.create_task(check_disconnect_periodically())
+    disconnect_check_task = asyncio.create_task(disconnect_poller(http_request))
+    disconnect_check_task.add_done_callback(_on_poller_done)
+    _active_disconnect_tasks.add(disconnect_check_task)
+    disconnect_check_task.add_done_callback(_active_disconnect_tasks.discard)
 
     def check_client_disconnected(stage: str = "") -> bool:
         if client_disconnected_event.is_set():
@@ -194,3 +169,12 @@ async def setup_disconnect_monitoring(
         return False
 
     return client_disconnected_event, disconnect_check_task, check_client_disconnected
+
+
+async def cancel_all_disconnect_tasks() -> None:
+    """Cancels every disconnect poller that is still running and waits for them."""
+    tasks = [task for task in _active_disconnect_tasks if not task.done()]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -159,9 +159,16 @@ async def ensure_request_lock():
                         await asyncio.wait_for(
                             GlobalState.RECOVERY_EVENT.wait(), timeout=30.0
                         )
-                    else:
-                        # Watchdog hasn't started yet, wait briefly
+                    elif GlobalState.QUOTA_RESET_EVENT.is_set():
+                        # Flag was raised without set_quota_exceeded(); the
+                        # event can't tell us anything, so wait briefly
                         await asyncio.sleep(0.1)
+                    else:
+                        # Watchdog hasn't started yet; wake as soon as quota
+                        # is reset, re-checking recovery state every second
+                        await asyncio.wait_for(
+                            GlobalState.QUOTA_RESET_EVENT.wait(), timeout=1.0
+                        )
                 except asyncio.TimeoutError:
                     await asyncio.sleep(0.1)
     finally:
@@ -45,3 +45,11 @@ def service_unavailable(req_id: str, retry_after_seconds: int = 30) -> HTTPExcep
         f"[{req_id}] Service currently unavailable. Please try again later.",
         headers={"Retry-After": str(retry_after_seconds)},
     )
+
+
+def queue_full(req_id: str, retry_after_seconds: int = 10) -> HTTPException:
+    return http_error(
+        429,
+        f"[{req_id}] Request queue is full. Please try again later.",
+        headers={"Retry-After": str(retry_after_seconds)},
+    )
@@ -1,4 +1,6 @@
 
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
 from playwright.async_api import Page as AsyncPage
 
 from api_utils.server_state import state
@@ -6,6 +8,24 @@ from logging_utils import set_request_id
 
 from .context_types import RequestContext
 
+# (source list, its length, ordered ids, id set) - rebuilt only when the
+# parsed model list is replaced or resized, not on every request.
+_valid_ids_cache: Tuple[
+    Optional[List[Dict[str, Any]]], int, Tuple[str, ...], FrozenSet[str]
+] = (None, -1, (), frozenset())
+
+
+def _get_valid_model_ids(
+    parsed_model_list: List[Dict[str, Any]],
+) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    global _valid_ids_cache
+    source, size, ids, id_set = _valid_ids_cache
+    if source is not parsed_model_list or size != len(parsed_model_list):
+        ids = tuple(str(m.get("id")) for m in parsed_model_list if m.get("id"))
+        id_set = frozenset(ids)
+        _valid_ids_cache = (parsed_model_list, len(parsed_model_list), ids, id_set)
+    return ids, id_set
+
 
 async def analyze_model_requirements(
     req_id: str, context: RequestContext, requested_model: str, proxy_model_name: str
@@ -20,10 +40,10 @@ async def analyze_model_requirements(
         logger.info(f"[{req_id}] Requesting model: {requested_model_id}")
 
         if parsed_model_list:
-            valid_model_ids = [
-                str(m.get("id")) for m in parsed_model_list if m.get("id")
-            ]
-            if requested_model_id not in valid_model_ids:
+            valid_model_ids, valid_model_id_set = _get_valid_model_ids(
+                parsed_model_list
+            )
+            if requested_model_id not in valid_model_id_set:
                 from .error_utils import bad_request
 
                 raise bad_request(
@@ -57,6 +77,11 @@ async def handle_model_switching(
     assert page is not None, "Page must be ready for model switching"
     assert model_id_to_use is not None, "Target model ID must be set"
 
+    # Fast path: another request may already have switched to the target
+    # while this one was queued. Re-checked under the lock below.
+    if state.current_ai_studio_model_id == model_id_to_use:
+        return context
+
     async with model_switching_lock:
         if state.current_ai_studio_model_id != model_id_to_use:
             logger.info(
@@ -107,6 +132,14 @@ async def handle_parameter_cache(req_id: str, context: RequestContext) -> None:
     current_ai_studio_model_id = context["current_ai_studio_model_id"]
     model_actually_switched = context["model_actually_switched"]
 
+    # Lock-free fast path: the common case is a request for the model the
+    # cache was built for, which needs no write and therefore no lock.
+    if not model_actually_switched and (
+        page_params_cache.get("last_known_model_id_for_params")
+        == current_ai_studio_model_id
+    ):
+        return
+
     async with params_cache_lock:
         cached_model_for_params = page_params_cache.get(
             "last_known_model_id_for_params"
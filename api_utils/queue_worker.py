@@ -15,7 +15,7 @@ from playwright.async_api import expect as expect_async
 from api_utils.context_types import QueueItem
 from models import QuotaExceededError
 
-from .client_connection import check_client_connection
+from .client_connection import DISCONNECT_POLL_INTERVAL, check_client_connection
 
 
 async def queue_worker() -> None:
@@ -219,8 +219,8 @@ async def queue_worker() -> None:
                 request_queue.task_done()
                 continue
 
-            # Streaming delay
-            current_time = time.time()
+            # Streaming delay (monotonic: a wall-clock step back must not stall the worker)
+            current_time = time.monotonic()
             if (
                 was_last_request_streaming
                 and is_streaming_request
@@ -296,7 +296,7 @@ async def queue_worker() -> None:
                                                 break
                                         else:
                                             disco_count = 0
-                                        await asyncio.sleep(0.2)
+                                        await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
 
                                 disconnect_monitor_task = asyncio.create_task(
                                     enhanced_disconnect_monitor_fn()
@@ -327,7 +327,7 @@ async def queue_worker() -> None:
                                             )
                                         )
                                         break
-                                    await asyncio.sleep(0.3)
+                                    await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
 
                             disconnect_monitor_task = asyncio.create_task(
                                 non_streaming_monitor_fn()
@@ -432,13 +432,14 @@ async def queue_worker() -> None:
                             except Exception:
                                 try:
                                     await s_page.reload()
+                                    state.invalidate_params_cache()
                                 except Exception:
                                     pass
             except Exception as e:
                 logger.error(f"[{req_id}] Cleanup error: {e}")
 
             was_last_request_streaming = is_streaming_request
-            last_request_completion_time = time.time()
+            last_request_completion_time = time.monotonic()
 
         except asyncio.CancelledError:
             if result_future and not result_future.done():
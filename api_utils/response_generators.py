@@ -45,6 +45,21 @@ def _clean_body_text(body: str) -> str:
     return _CONTROL_CHAR_PATTERN.sub("", body)
 
 
+async def _wait_for_state_event(event: Event, timeout: float = 1.0) -> None:
+    """Wait up to ``timeout`` seconds, returning early once ``event`` is set.
+
+    Falls back to a plain sleep if the event is already set, so a caller
+    looping on a flag that was raised without clearing the event cannot spin.
+    """
+    if event.is_set():
+        await asyncio.sleep(timeout)
+        return
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
 async def resilient_stream_generator(
     req_id: str,
     model_name: str,
@@ -195,7 +210,7 @@ async def gen_sse_from_aux_stream(
                         yield generate_sse_stop_chunk(req_id, model_name_for_stream)
                         break
                     yield ": heartbeat\n\n"
-                    await asyncio.sleep(1.0)
+                    await _wait_for_state_event(GlobalState.RECOVERY_EVENT)
 
                 if GlobalState.IS_RECOVERING:
                     break
@@ -378,7 +393,11 @@ async def gen_sse_from_aux_stream(
                 elif is_recovering or is_quota_exceeded:
                     while GlobalState.IS_QUOTA_EXCEEDED or GlobalState.IS_RECOVERING:
                         yield ": heartbeat\n\n"
-                        await asyncio.sleep(1.0)
+                        await _wait_for_state_event(
+                            GlobalState.RECOVERY_EVENT
+                            if GlobalState.IS_RECOVERING
+                            else GlobalState.QUOTA_RESET_EVENT
+                        )
 
                 if function:
                     finish_reason = "tool_calls"
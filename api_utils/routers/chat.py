@@ -7,7 +7,11 @@ from asyncio import Future, Queue
 from fastapi import Depends, HTTPException, Request
 from fastapi.responses import JSONResponse
 
-from config import RESPONSE_COMPLETION_TIMEOUT, get_environment_variable
+from config import (
+    REQUEST_QUEUE_MAX_SIZE,
+    RESPONSE_COMPLETION_TIMEOUT,
+    get_environment_variable,
+)
 from logging_utils import set_request_id, set_source
 from models import ChatCompletionRequest
 
@@ -18,7 +22,7 @@ from ..dependencies import (
     get_server_state,
     get_worker_task,
 )
-from ..error_utils import service_unavailable
+from ..error_utils import queue_full, service_unavailable
 
 
 async def chat_completions(
@@ -58,6 +62,12 @@ async def chat_completions(
     if is_service_unavailable:
         raise service_unavailable(req_id)
 
+    if REQUEST_QUEUE_MAX_SIZE > 0 and request_queue.qsize() >= REQUEST_QUEUE_MAX_SIZE:
+        logger.warning(
+            f"Request queue full ({request_queue.qsize()}/{REQUEST_QUEUE_MAX_SIZE}), rejecting request"
+        )
+        raise queue_full(req_id)
+
     result_future = Future()
     queue_item = {
         "req_id": req_id,
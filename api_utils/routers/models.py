@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from asyncio import Event
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from fastapi import Depends
 from playwright.async_api import Page as AsyncPage
@@ -18,6 +18,38 @@ from ..dependencies import (
     get_parsed_model_list,
 )
 
+# (model list, its length, excluded ids, their count, visible models) - rebuilt
+# only when either input is replaced or resized, not on every /v1/models poll.
+_visible_models_cache: Tuple[
+    Optional[List[Dict[str, Any]]], int, Optional[Set[str]], int, List[Dict[str, Any]]
+] = (None, -1, None, -1, [])
+
+
+def _get_visible_models(
+    parsed_model_list: List[Dict[str, Any]], excluded_model_ids: Set[str]
+) -> List[Dict[str, Any]]:
+    global _visible_models_cache
+    source, size, excluded, excluded_size, visible = _visible_models_cache
+    if (
+        source is not parsed_model_list
+        or size != len(parsed_model_list)
+        or excluded is not excluded_model_ids
+        or excluded_size != len(excluded_model_ids)
+    ):
+        visible = [
+            m
+            for m in parsed_model_list
+            if isinstance(m, dict) and m.get("id") not in excluded_model_ids
+        ]
+        _visible_models_cache = (
+            parsed_model_list,
+            len(parsed_model_list),
+            excluded_model_ids,
+            len(excluded_model_ids),
+            visible,
+        )
+    return visible
+
 
 async def list_models(
     logger: logging.Logger = Depends(get_logger),
@@ -49,11 +81,7 @@ async def list_models(
                 model_list_fetch_event.set()
 
     if parsed_model_list:
-        final_model_list = [
-            m
-            for m in parsed_model_list
-            if isinstance(m, dict) and m.get("id") not in excluded_model_ids
-        ]
+        final_model_list = _get_visible_models(parsed_model_list, excluded_model_ids)
         return {"object": "list", "data": final_model_list}
     else:
         logger.warning("Model list is empty, returning default fallback model.")
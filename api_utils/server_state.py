@@ -96,6 +96,10 @@ class ServerState:
         self.should_exit: bool = False
         self.quota_watchdog: Optional[Callable] = None
 
+    def invalidate_params_cache(self) -> None:
+        """Forget cached UI parameters (the page was reloaded or re-navigated)."""
+        self.page_params_cache.clear()
+
     def clear_debug_logs(self) -> None:
         """Clear console and network logs (called after each request)."""
         self.console_logs = []
@@ -435,6 +435,7 @@ async def use_stream_response(
                         page_instance = state.page_instance
                         if page_instance:
                             await page_instance.reload()
+                            state.invalidate_params_cache()
                     except Exception:
                         pass
                     yield {
@@ -699,7 +699,11 @@ async def perform_auth_rotation(target_model_id: str = None) -> bool:
                 logger.info("✅ Injected new cookies.")
 
                 # 4. Perform Canary Test
-                if await _perform_canary_test(state.page_instance):
+                canary_ok = await _perform_canary_test(state.page_instance)
+                # The canary navigated to a fresh chat, so cached UI params
+                # no longer describe the page
+                state.invalidate_params_cache()
+                if canary_ok:
                     # Healthy profile found, break the loop
                     GlobalState.reset_quota_status()
                     # GlobalState.current_profile_token_count = 0 # Removed: handled by reset_quota_status
@@ -30,6 +30,7 @@ from config import (
 )
 from config.selector_utils import (
     INPUT_WRAPPER_SELECTORS,
+    find_first_visible_locator,
 )
 
 from .auth import wait_for_model_list_and_handle_auth_save
@@ -55,6 +56,14 @@ async def initialize_page_logic(  # pragma: no cover
         browser: Playwright browser instance
         storage_state_path: Optional authentication file path. If provided, it will be prioritized.
     """
+    # Delayed imports to avoid circular dependency, done once per call instead
+    # of at each branch that needs them
+    from api_utils.server_state import state
+    from browser_utils.operations import (
+        _handle_model_list_response,
+        save_error_snapshot,
+    )
+
     logger.debug("[Init] Initializing page logic")
     temp_context: Optional[AsyncBrowserContext] = None
     storage_state_path_to_use: Optional[str] = None
@@ -180,21 +189,15 @@ async def initialize_page_logic(  # pragma: no cover
         context_options: Dict[str, Any] = {"viewport": {"width": 460, "height": 800}}
         if storage_state_path_to_use:
             context_options["storage_state"] = storage_state_path_to_use
-            from api_utils.server_state import state
-
             state.current_auth_profile_path = storage_state_path_to_use
             logger.info(
                 f"   (Using storage_state='{os.path.basename(storage_state_path_to_use)}')"
             )
         else:
-            from api_utils.server_state import state
-
             state.current_auth_profile_path = None
             logger.info("   (Not using storage_state)")
 
         # Proxy settings need to be retrieved from the server module
-        from api_utils.server_state import state
-
         if state.PLAYWRIGHT_PROXY_SETTINGS:
             context_options["proxy"] = state.PLAYWRIGHT_PROXY_SETTINGS
             logger.debug(
@@ -221,9 +224,6 @@ async def initialize_page_logic(  # pragma: no cover
         login_url_pattern = "accounts.google.com"
         current_url = ""
 
-        # Import _handle_model_list_response - delayed import to avoid circular dependency
-        from browser_utils.operations import _handle_model_list_response
-
         for p_iter in pages:
             try:
                 page_url_to_check = p_iter.url
@@ -275,9 +275,6 @@ async def initialize_page_logic(  # pragma: no cover
             except asyncio.CancelledError:
                 raise
             except Exception as new_page_nav_err:
-                # Import save_error_snapshot function
-                from browser_utils.operations import save_error_snapshot
-
                 await save_error_snapshot("init_new_page_nav_fail")
                 error_str = str(new_page_nav_err)
                 if "NS_ERROR_NET_INTERRUPT" in error_str:
@@ -361,8 +358,6 @@ async def initialize_page_logic(  # pragma: no cover
                 except asyncio.CancelledError:
                     raise
                 except Exception as wait_login_err:
-                    from browser_utils.operations import save_error_snapshot
-
                     await save_error_snapshot("init_login_wait_fail")
                     logger.error(
                         f"Failed to detect AI Studio URL after login prompt or error saving status: {wait_login_err}",
@@ -373,8 +368,6 @@ async def initialize_page_logic(  # pragma: no cover
                     ) from wait_login_err
 
         elif target_url_base not in current_url or "/prompts/" not in current_url:
-            from browser_utils.operations import save_error_snapshot
-
             await save_error_snapshot("init_unexpected_page")
             logger.error(
                 f"Unexpected page URL after initial navigation: {current_url}. Expected it to contain '{target_url_base}' and '/prompts/'."
@@ -389,8 +382,6 @@ async def initialize_page_logic(  # pragma: no cover
             # Use centralized selector fallback logic to find input container
             # Supports current and old UI structures (ms-prompt-input-wrapper / ms-chunk-editor / ms-prompt-box)
             # Use find_first_visible_locator to wait for element visibility, solving timing issues in headless mode
-            from config.selector_utils import find_first_visible_locator
-
             # Wrap in a way that respects the shutdown signal
             async def find_locator_task():
                 return await find_first_visible_locator(
@@ -450,8 +441,6 @@ async def initialize_page_logic(  # pragma: no cover
         except asyncio.CancelledError:
             raise
         except Exception as input_visible_err:
-            from browser_utils.operations import save_error_snapshot
-
             await save_error_snapshot("init_fail_input_timeout")
             logger.error(
                 f"Page initialization failed: core input area did not become visible within expected time. Last URL was {found_page.url}",
@@ -491,8 +480,6 @@ async def initialize_page_logic(  # pragma: no cover
                 raise
             except Exception as close_err:
                 logger.warning(f"Error closing temporary browser context: {close_err}")
-        from browser_utils.operations import save_error_snapshot
-
         await save_error_snapshot("init_unexpected_error")
         raise RuntimeError(
             f"Unexpected page initialization error: {e_init_page}"
@@ -2,11 +2,16 @@
 import asyncio
 import logging
 import os
+from typing import Dict, Optional, Tuple
 
 from playwright.async_api import BrowserContext as AsyncBrowserContext
 
 logger = logging.getLogger("AIStudioProxyServer")
 
+# (path, st_mtime_ns) -> cleaned script, so recreated contexts skip the read
+_USERSCRIPT_CACHE: Dict[Tuple[str, int], str] = {}
+_USERSCRIPT_CACHE_MAX_ENTRIES = 4
+
 
 async def add_init_scripts_to_context(context: AsyncBrowserContext):
     """Add initialization scripts to browser context (fallback option)"""
@@ -20,12 +25,7 @@ async def add_init_scripts_to_context(context: AsyncBrowserContext):
             )
             return
 
-        # Read script content
-        with open(USERSCRIPT_PATH, "r", encoding="utf-8") as f:
-            script_content = f.read()
-
-        # Clean UserScript headers
-        cleaned_script = _clean_userscript_headers(script_content)
+        cleaned_script = _load_cleaned_userscript(USERSCRIPT_PATH)
 
         # Add to context initialization scripts
         await context.add_init_script(cleaned_script)
@@ -39,6 +39,29 @@ async def add_init_scripts_to_context(context: AsyncBrowserContext):
         logger.error(f"Error adding initialization script to context: {e}")
 
 
+def _load_cleaned_userscript(path: str) -> str:
+    """Read and clean the userscript, reusing the result until the file changes"""
+    key: Optional[Tuple[str, int]]
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        key = None
+    if key is not None:
+        cached = _USERSCRIPT_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    with open(path, "r", encoding="utf-8") as f:
+        cleaned_script = _clean_userscript_headers(f.read())
+
+    if key is not None:
+        if len(_USERSCRIPT_CACHE) >= _USERSCRIPT_CACHE_MAX_ENTRIES:
+            # FIFO: drop the oldest entry
+            _USERSCRIPT_CACHE.pop(next(iter(_USERSCRIPT_CACHE)))
+        _USERSCRIPT_CACHE[key] = cleaned_script
+    return cleaned_script
+
+
 def _clean_userscript_headers(script_content: str) -> str:
     """Clean UserScript header information"""
     lines = script_content.split("\n")
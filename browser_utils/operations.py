@@ -139,6 +139,11 @@ async def get_raw_text_content(
 
 async def _handle_model_list_response(response: Any):
     """Handle model list response"""
+    # Registered for every response the page receives: bail out before any
+    # state lookups unless this is the model list
+    if MODELS_ENDPOINT_URL_CONTAINS not in response.url:
+        return
+
     # Need access to global variables
     from api_utils.server_state import state
 
@@ -147,7 +152,7 @@ async def _handle_model_list_response(response: Any):
     model_list_fetch_event = state.model_list_fetch_event
     excluded_model_ids = state.excluded_model_ids
 
-    if MODELS_ENDPOINT_URL_CONTAINS in response.url and response.ok:
+    if response.ok:
         # Check if in login flow
         launch_mode = os.environ.get("LAUNCH_MODE", "debug")
         is_in_login_flow = launch_mode in ["debug"] and not state.is_page_ready
@@ -478,22 +483,6 @@ async def _handle_model_list_response(response: Any):
                         )
 
                 if new_parsed_list:
-                    # Check if already has network intercepted injected models
-                    has_network_injected_models = False
-                    if models_array_container:
-                        for entry_in_container in models_array_container:
-                            if (
-                                isinstance(entry_in_container, list)
-                                and len(entry_in_container) > 10
-                            ):
-                                # Check for network injection marker
-                                if "__NETWORK_INJECTED__" in entry_in_container:
-                                    has_network_injected_models = True
-                                    break
-
-                    if has_network_injected_models and not is_in_login_flow:
-                        logger.info("Detected network interception injected models")
-
                     # Note: No longer add injected models in backend
                     # Only rely on network interception injection
 
@@ -526,7 +515,7 @@ async def _handle_model_list_response(response: Any):
                     model_list_fetch_event.set()
         except json.JSONDecodeError as json_err:
             logger.error(
-                f"Failed to parse model list JSON: {json_err}. Response (first 500 chars): {await response.text()[:500]}"
+                f"Failed to parse model list JSON: {json_err}. Response (first 500 chars): {(await response.body())[:500].decode('utf-8', 'replace')}"
             )
         except Exception as e_handle_list_resp:
             logger.exception(
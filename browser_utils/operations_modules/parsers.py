@@ -16,6 +16,11 @@ logger = logging.getLogger("AIStudioProxyServer")
 
 async def _handle_model_list_response(response: Any):
     """Handle model list response"""
+    # Registered for every response the page receives: bail out before any
+    # state lookups unless this is the model list
+    if MODELS_ENDPOINT_URL_CONTAINS not in response.url:
+        return
+
     # Need to access global variables
     from api_utils.server_state import state
 
@@ -24,7 +29,7 @@ async def _handle_model_list_response(response: Any):
     model_list_fetch_event = getattr(state, "model_list_fetch_event", None)
     excluded_model_ids = getattr(state, "excluded_model_ids", set())
 
-    if MODELS_ENDPOINT_URL_CONTAINS in response.url and response.ok:
+    if response.ok:
         # Check if in login flow
         launch_mode = os.environ.get("LAUNCH_MODE", "debug")
         is_in_login_flow = launch_mode in ["debug"] and not getattr(
@@ -323,24 +328,6 @@ async def _handle_model_list_response(response: Any):
                 )
 
                 if new_parsed_list:
-                    # Check if network interception already injected models
-                    has_network_injected_models = False
-                    if models_array_container:
-                        for entry_in_container in models_array_container:
-                            if (
-                                isinstance(entry_in_container, list)
-                                and len(entry_in_container) > 10
-                            ):
-                                # Check for network injection marker
-                                if "__NETWORK_INJECTED__" in entry_in_container:
-                                    has_network_injected_models = True
-                                    break
-
-                    if has_network_injected_models and not is_in_login_flow:
-                        logger.info(
-                            "Detected network interception already injected models"
-                        )
-
                     # Note: No longer adding injected models on backend
                     # If frontend didn't inject via network interception, these models won't be usable anyway
                     # So we only rely on network interception for injection
@@ -392,7 +379,7 @@ async def _handle_model_list_response(response: Any):
                     model_list_fetch_event.set()
         except json.JSONDecodeError as json_err:
             logger.error(
-                f"Failed to parse model list JSON: {json_err}. Response (first 500 chars): {await response.text()[:500]}"
+                f"Failed to parse model list JSON: {json_err}. Response (first 500 chars): {(await response.body())[:500].decode('utf-8', 'replace')}"
             )
         except asyncio.CancelledError:
             raise
@@ -10,6 +10,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from playwright.async_api import Page as AsyncPage
 from playwright.async_api import expect as expect_async
 
+from api_utils.server_state import state
 from config import (
     CLEAR_CHAT_BUTTON_SELECTOR,
     CLEAR_CHAT_CONFIRM_BUTTON_SELECTOR,
@@ -254,6 +255,7 @@ class PageController(
     async def _safe_reload_page(self):
         """Reload page safely."""
         await self.page.reload(timeout=30000)
+        state.invalidate_params_cache()
         await self.page.wait_for_load_state("domcontentloaded", timeout=30000)
 
     async def get_response(
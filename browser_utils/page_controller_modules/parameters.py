@@ -122,13 +122,19 @@ class ParameterController(BaseController):
         check_client_disconnected: Callable,
     ):
         """Adjust temperature parameter."""
-        async with params_cache_lock:
-            clamped_temp = max(0.0, min(2.0, temperature))
-            if clamped_temp != temperature:
-                self.logger.warning(
-                    f"Temperature {temperature} out of range [0, 2], clamped to {clamped_temp}"
-                )
+        clamped_temp = max(0.0, min(2.0, temperature))
+        if clamped_temp != temperature:
+            self.logger.warning(
+                f"Temperature {temperature} out of range [0, 2], clamped to {clamped_temp}"
+            )
+
+        # Cache hits are a plain dict read; only take the lock to touch the page
+        cached_temp = page_params_cache.get("temperature")
+        if cached_temp is not None and abs(cached_temp - clamped_temp) < 0.001:
+            self.logger.debug(f"[Param] Temperature: {clamped_temp} (Cached)")
+            return
 
+        async with params_cache_lock:
             cached_temp = page_params_cache.get("temperature")
             if cached_temp is not None and abs(cached_temp - clamped_temp) < 0.001:
                 self.logger.debug(f"[Param] Temperature: {clamped_temp} (Cached)")
@@ -216,43 +222,48 @@ class ParameterController(BaseController):
         check_client_disconnected: Callable,
     ):
         """Adjust max output tokens parameter."""
-        async with params_cache_lock:
-            min_val_for_tokens = 1
-            max_val_for_tokens_from_model = 65536
+        min_val_for_tokens = 1
+        max_val_for_tokens_from_model = 65536
 
-            if model_id_to_use and parsed_model_list:
-                current_model_data = next(
-                    (m for m in parsed_model_list if m.get("id") == model_id_to_use),
-                    None,
-                )
-                if (
-                    current_model_data
-                    and current_model_data.get("supported_max_output_tokens")
-                    is not None
-                ):
-                    try:
-                        supported_tokens = int(
-                            current_model_data["supported_max_output_tokens"]
-                        )
-                        if supported_tokens > 0:
-                            max_val_for_tokens_from_model = supported_tokens
-                        else:
-                            self.logger.warning(
-                                f"Model {model_id_to_use} has invalid supported_max_output_tokens: {supported_tokens}"
-                            )
-                    except (ValueError, TypeError):
+        if model_id_to_use and parsed_model_list:
+            current_model_data = next(
+                (m for m in parsed_model_list if m.get("id") == model_id_to_use),
+                None,
+            )
+            if (
+                current_model_data
+                and current_model_data.get("supported_max_output_tokens") is not None
+            ):
+                try:
+                    supported_tokens = int(
+                        current_model_data["supported_max_output_tokens"]
+                    )
+                    if supported_tokens > 0:
+                        max_val_for_tokens_from_model = supported_tokens
+                    else:
                         self.logger.warning(
-                            f"Model {model_id_to_use} supported_max_output_tokens parse failed"
+                            f"Model {model_id_to_use} has invalid supported_max_output_tokens: {supported_tokens}"
                         )
+                except (ValueError, TypeError):
+                    self.logger.warning(
+                        f"Model {model_id_to_use} supported_max_output_tokens parse failed"
+                    )
 
-            clamped_max_tokens = max(
-                min_val_for_tokens, min(max_val_for_tokens_from_model, max_tokens)
+        clamped_max_tokens = max(
+            min_val_for_tokens, min(max_val_for_tokens_from_model, max_tokens)
+        )
+        if clamped_max_tokens != max_tokens:
+            self.logger.debug(
+                f"[Param] Max Tokens: {max_tokens} -> {clamped_max_tokens} (Clamped)"
             )
-            if clamped_max_tokens != max_tokens:
-                self.logger.debug(
-                    f"[Param] Max Tokens: {max_tokens} -> {clamped_max_tokens} (Clamped)"
-                )
 
+        # Cache hits are a plain dict read; only take the lock to touch the page
+        cached_max_tokens = page_params_cache.get("max_output_tokens")
+        if cached_max_tokens is not None and cached_max_tokens == clamped_max_tokens:
+            self.logger.debug(f"[Param] Max Tokens: {clamped_max_tokens} (Cached)")
+            return
+
+        async with params_cache_lock:
             cached_max_tokens = page_params_cache.get("max_output_tokens")
             if (
                 cached_max_tokens is not None
@@ -57,6 +57,26 @@ class ThinkingController(BaseController):
         """Handle adjustments for thinking mode and budget."""
         reasoning_effort = request_params.get("reasoning_effort")
 
+        # Cache hits and non-thinking models need no page work, so they are
+        # answered with plain dict reads/writes instead of waiting on the lock
+        if (
+            "reasoning_effort" in page_params_cache
+            and page_params_cache["reasoning_effort"] == reasoning_effort
+        ):
+            self.logger.debug(
+                f"[Thinking] Reasoning effort {reasoning_effort} matches cache, skipping"
+            )
+            return
+
+        # Determine processing logic based on model category
+        category = self._get_thinking_category(model_id_to_use)
+        if category == ThinkingCategory.NON_THINKING:
+            self.logger.debug(
+                "[Thinking] This model does not support thinking mode, skipping config"
+            )
+            page_params_cache["reasoning_effort"] = reasoning_effort
+            return
+
         try:
             async with params_cache_lock:
                 if (
@@ -68,15 +88,6 @@ class ThinkingController(BaseController):
                     )
                     return
 
-                # Determine processing logic based on model category
-                category = self._get_thinking_category(model_id_to_use)
-                if category == ThinkingCategory.NON_THINKING:
-                    self.logger.debug(
-                        "[Thinking] This model does not support thinking mode, skipping config"
-                    )
-                    page_params_cache["reasoning_effort"] = reasoning_effort
-                    return
-
                 directive = normalize_reasoning_effort_with_stream_check(
                     reasoning_effort, is_streaming
                 )
@@ -28,6 +28,10 @@ class GlobalState:
     # Global Event to signal Quota Exceeded immediately
     QUOTA_EXCEEDED_EVENT = asyncio.Event()
 
+    # Inverse of QUOTA_EXCEEDED_EVENT: set whenever quota is (back to) OK, so
+    # parked requests can wait for the reset instead of polling the flag
+    QUOTA_RESET_EVENT = asyncio.Event()
+
     # Event to signal that a rotation operation has completed.
     rotation_complete_event = asyncio.Event()
 
@@ -94,6 +98,8 @@ class GlobalState:
     def init_rotation_lock(cls):
         """Initialize the rotation lock to allow requests."""
         cls.AUTH_ROTATION_LOCK.set()
+        if not cls.IS_QUOTA_EXCEEDED:
+            cls.QUOTA_RESET_EVENT.set()
         logger.info("🔐 Global Auth Rotation Lock initialized (OPEN).")
 
     @classmethod
@@ -106,6 +112,7 @@ class GlobalState:
         if not cls.IS_QUOTA_EXCEEDED:
             cls.IS_QUOTA_EXCEEDED = True
             cls.QUOTA_EXCEEDED_TIMESTAMP = time.time()
+            cls.QUOTA_RESET_EVENT.clear()
             cls.QUOTA_EXCEEDED_EVENT.set()
 
             # Determine error type
@@ -151,6 +158,7 @@ class GlobalState:
         cls.QUOTA_EXCEEDED_TIMESTAMP = 0.0
         cls.last_error_type = None
         cls.QUOTA_EXCEEDED_EVENT.clear()
+        cls.QUOTA_RESET_EVENT.set()
 
         # [QUOTA-02] Reset model usage stats
         cls.current_profile_model_usage.clear()
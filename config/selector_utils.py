@@ -102,25 +102,41 @@ async def find_first_visible_locator(
             f"[Selector] {description}: '{primary_selector}' timeout ({primary_timeout}ms) - {type(e).__name__}"
         )
 
-    # Fall back to other selectors
+    # Fall back to other selectors: wait on all of them at once, then take
+    # results in priority order, so stale selectors cost one fallback timeout
+    # in total rather than one each
     if len(selectors) > 1:
         logger.debug(
             f"[Selector] {description}: Trying {len(selectors) - 1} fallback selectors (timeout: {fallback_timeout}ms)"
         )
-        for idx, selector in enumerate(selectors[1:], 2):
-            try:
-                locator = page.locator(selector)
-                await expect_async(locator).to_be_visible(timeout=fallback_timeout)
-                logger.debug(
-                    f"[Selector] {description}: '{selector}' element visible (fallback {idx}/{len(selectors)})"
-                )
-                return locator, selector
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                logger.debug(
-                    f"[Selector] {description}: '{selector}' timeout (fallback {idx}/{len(selectors)})"
-                )
+
+        async def wait_visible(selector: str) -> Locator:
+            locator = page.locator(selector)
+            await expect_async(locator).to_be_visible(timeout=fallback_timeout)
+            return locator
+
+        fallback_selectors = selectors[1:]
+        tasks = [asyncio.ensure_future(wait_visible(s)) for s in fallback_selectors]
+        try:
+            for idx, (selector, task) in enumerate(zip(fallback_selectors, tasks), 2):
+                try:
+                    locator = await task
+                    logger.debug(
+                        f"[Selector] {description}: '{selector}' element visible (fallback {idx}/{len(selectors)})"
+                    )
+                    return locator, selector
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.debug(
+                        f"[Selector] {description}: '{selector}' timeout (fallback {idx}/{len(selectors)})"
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Reap the lower-priority waits so their failures are not reported
+            # as never retrieved
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     logger.warning(
         f"[Selector] {description}: No visible element found for any selector "
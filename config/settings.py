@@ -90,6 +90,18 @@ ONLY_COLLECT_CURRENT_USER_ATTACHMENTS = get_boolean_env(
     "ONLY_COLLECT_CURRENT_USER_ATTACHMENTS", False
 )
 
+# --- Server Threadpool Configuration ---
+# Upper bound for worker threads used by blocking calls (asyncio.to_thread,
+# run_in_executor and Starlette's threadpool). The library defaults (40 for
+# anyio, min(32, cpu+4) for asyncio) are easily exhausted by parked waits.
+THREADPOOL_MAX_WORKERS = get_int_env("THREADPOOL_MAX_WORKERS", 200)
+
+# --- Request Queue Configuration ---
+# Reject new chat requests with 429 once this many are already waiting.
+# Requests are served one at a time by a single page, so an unbounded
+# backlog only turns into client-side timeouts. 0 disables the limit.
+REQUEST_QUEUE_MAX_SIZE = get_int_env("REQUEST_QUEUE_MAX_SIZE", 0)
+
 # --- Response Integrity Verification Configuration ---
 EMERGENCY_WAIT_SECONDS = get_int_env("EMERGENCY_WAIT_SECONDS", 3)
 
@@ -3,6 +3,7 @@
 import argparse
 import asyncio
 import atexit
+import contextlib
 import json
 import logging
 import logging.handlers
@@ -1772,70 +1773,53 @@ if __name__ == "__main__":
                 access_log=False,
             )
 
-            # [ID-03] Custom Server to prevent Uvicorn from overriding signal handlers
+            # [ID-03] Custom Server that registers its signal handlers on the
+            # running event loop. uvicorn's own capture_signals() installs
+            # plain signal.signal handlers, which run in an arbitrary frame and
+            # would replace anything installed before server.run().
             class CustomUvicornServer(uvicorn.Server):
-                def install_signal_handlers(self):
-                    # We handle signals ourselves
-                    pass
+                @contextlib.contextmanager
+                def capture_signals(self):
+                    if threading.current_thread() is not threading.main_thread():
+                        yield
+                        return
 
-            server = CustomUvicornServer(server_config)
-
-            # Install custom signal handlers that cancel asyncio tasks
-            def install_custom_signal_handlers():
-                """Install custom signal handlers for immediate asyncio task cancellation"""
-                import signal
-
-                def signal_handler(signum, frame):
-                    logger.info(
-                        f"[ID-03] 🚨 Received signal {signum}. Setting shutdown event and cancelling tasks..."
-                    )
-                    GlobalState.IS_SHUTTING_DOWN.set()
+                    def on_signal(signum: int) -> None:
+                        logger.info(
+                            f"[ID-03] 🚨 Received signal {signum}. Setting shutdown event..."
+                        )
+                        GlobalState.IS_SHUTTING_DOWN.set()
+                        self.handle_exit(signum, None)
+                        logger.info("[ID-03] Uvicorn server exit requested.")
 
-                    # Cancel all asyncio tasks immediately
+                    loop = asyncio.get_running_loop()
+                    handled = (signal.SIGINT, signal.SIGTERM)
+                    original_handlers = {sig: signal.getsignal(sig) for sig in handled}
                     try:
-                        loop = asyncio.get_event_loop()
-                        if loop.is_running():
-                            # Get all tasks except the current one
-                            tasks = [
-                                t
-                                for t in asyncio.all_tasks(loop)
-                                if not t.done() and t is not asyncio.current_task()
-                            ]
-                            logger.info(
-                                f"[ID-03] Cancelling {len(tasks)} asyncio tasks..."
-                            )
-                            for task in tasks:
-                                task.cancel()
-
-                            # Give tasks a brief moment to acknowledge cancellation
-                            async def wait_for_cancellation():
-                                try:
-                                    await asyncio.wait_for(
-                                        asyncio.gather(*tasks, return_exceptions=True),
-                                        timeout=3.0,
-                                    )
-                                except asyncio.TimeoutError:
-                                    logger.warning(
-                                        "[ID-03] Timeout waiting for tasks to cancel."
-                                    )
-
-                            loop.create_task(wait_for_cancellation())
-                    except Exception as e:
-                        logger.warning(f"[ID-03] Error cancelling asyncio tasks: {e}")
-
-                    # Force server to exit
-                    server.should_exit = True
-                    logger.info("[ID-03] Uvicorn server exit requested.")
-
-                # Install handlers for SIGINT and SIGTERM
-                signal.signal(signal.SIGINT, signal_handler)
-                signal.signal(signal.SIGTERM, signal_handler)
-                logger.info(
-                    "[ID-03] Custom signal handlers installed for immediate shutdown."
-                )
+                        for sig in handled:
+                            loop.add_signal_handler(sig, on_signal, sig)
+                    except NotImplementedError:
+                        # Windows event loops have no add_signal_handler
+                        with super().capture_signals():
+                            yield
+                        return
+
+                    logger.info("[ID-03] Signal handlers installed on the event loop.")
+                    try:
+                        yield
+                    finally:
+                        # remove_signal_handler resets to the default, so put
+                        # the launcher's own handlers back explicitly
+                        for sig, handler in original_handlers.items():
+                            loop.remove_signal_handler(sig)
+                            signal.signal(sig, handler)
+                    # Like uvicorn: re-deliver captured signals (LIFO) now that
+                    # the server has shut down, so the process exits the way
+                    # the signal asked it to
+                    for captured_signal in reversed(self._captured_signals):
+                        signal.raise_signal(captured_signal)
 
-            # Install our custom handlers
-            install_custom_signal_handlers()
+            server = CustomUvicornServer(server_config)
 
             # Run server with enhanced shutdown handling
             server.run()
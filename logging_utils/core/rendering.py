@@ -32,6 +32,22 @@ def normalize_source(source: str) -> str:
     return source[:5].upper().ljust(5)
 
 
+# (second, "HH:MM:SS") of the last formatted record; every handler formats the
+# same record, so the strftime result is usually reused
+_clock_cache: Tuple[int, str] = (-1, "")
+
+
+def format_clock(created: float) -> str:
+    """Format a record timestamp as HH:MM:SS.mmm (local time, no date)."""
+    global _clock_cache
+    second = int(created)
+    cached_second, clock = _clock_cache
+    if second != cached_second:
+        clock = time.strftime("%H:%M:%S", time.localtime(second))
+        _clock_cache = (second, clock)
+    return f"{clock}.{int((created - second) * 1000):03d}"
+
+
 # =============================================================================
 # Semantic Highlighter (Enhanced)
 # =============================================================================
@@ -308,8 +324,7 @@ class GridFormatter(logging.Formatter):
         source_normalized = normalize_source(source)
 
         # Column 1: Time (HH:MM:SS.mmm) - no date
-        now = datetime.now()
-        timestamp = now.strftime("%H:%M:%S.") + f"{int(now.microsecond / 1000):03d}"
+        timestamp = format_clock(record.created)
         if self.colorize:
             time_col = f"{Colors.TIME}{timestamp}{Colors.RESET}"
         else:
@@ -397,8 +412,7 @@ class PlainGridFormatter(logging.Formatter):
 
         source_normalized = normalize_source(source)
 
-        now = datetime.now()
-        timestamp = now.strftime("%H:%M:%S.") + f"{int(now.microsecond / 1000):03d}"
+        timestamp = format_clock(record.created)
 
         level_abbrev = Colors.LEVEL_ABBREV.get(
             record.levelname, record.levelname[:3].upper()
@@ -3,10 +3,13 @@ import datetime
 import json
 import logging
 import sys
-from typing import Dict, List
+from collections import deque
+from typing import Deque, Dict, List, Optional
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+logger = logging.getLogger("AIStudioProxyServer")
+
 
 class StreamToLogger:
     def __init__(self, logger_instance: logging.Logger, log_level: int = logging.INFO):
@@ -17,12 +20,14 @@ class StreamToLogger:
     def write(self, buf: str):
         try:
             temp_linebuf = self.linebuf + buf
-            self.linebuf = ""
-            for line in temp_linebuf.splitlines(True):
-                if line.endswith(("\n", "\r")):
-                    self.logger.log(self.log_level, line.rstrip())
-                else:
-                    self.linebuf += line
+            # Split once at the last line end; only the trailing partial line is kept
+            end = max(temp_linebuf.rfind("\n"), temp_linebuf.rfind("\r"))
+            if end < 0:
+                self.linebuf = temp_linebuf
+                return
+            self.linebuf = temp_linebuf[end + 1 :]
+            for line in temp_linebuf[: end + 1].splitlines():
+                self.logger.log(self.log_level, line.rstrip())
         except Exception as e:
             print(f"StreamToLogger Error: {e}", file=sys.__stderr__)
 
@@ -38,6 +43,10 @@ class StreamToLogger:
         return False
 
 
+# A log client that cannot take a frame within this long is dropped
+_WS_SEND_TIMEOUT_SECONDS = 5.0
+
+
 class WebSocketConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
@@ -45,7 +54,6 @@ class WebSocketConnectionManager:
     async def connect(self, client_id: str, websocket: WebSocket):
         await websocket.accept()
         self.active_connections[client_id] = websocket
-        logger = logging.getLogger("AIStudioProxyServer")
         logger.info(f"WebSocket logging client connected: {client_id}")
         try:
             await websocket.send_text(
@@ -64,38 +72,68 @@ class WebSocketConnectionManager:
             logger.warning(f"Failed to send welcome message to WebSocket client {client_id}: {e}")
 
     def disconnect(self, client_id: str):
-        if client_id in self.active_connections:
-            del self.active_connections[client_id]
-            logger = logging.getLogger("AIStudioProxyServer")
+        if self.active_connections.pop(client_id, None) is not None:
             logger.info(f"WebSocket logging client disconnected: {client_id}")
 
     async def broadcast(self, message: str):
         if not self.active_connections:
             return
-        disconnected_clients: List[str] = []
         active_conns_copy = list(self.active_connections.items())
-        logger = logging.getLogger("AIStudioProxyServer")
-        for client_id, connection in active_conns_copy:
+
+        async def send_to_client(client_id: str, connection: WebSocket) -> Optional[str]:
+            """Send to one client; return its id if it should be dropped."""
             try:
-                await connection.send_text(message)
+                await asyncio.wait_for(
+                    connection.send_text(message), timeout=_WS_SEND_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"[WS Broadcast] Client {client_id} did not accept a log frame within "
+                    f"{_WS_SEND_TIMEOUT_SECONDS}s, dropping slow client."
+                )
+                return client_id
             except WebSocketDisconnect:
                 logger.info(f"[WS Broadcast] Client {client_id} disconnected during broadcast.")
-                disconnected_clients.append(client_id)
+                return client_id
             except RuntimeError as e:
                 if "Connection is closed" in str(e):
                     logger.info(f"[WS Broadcast] Connection for client {client_id} is closed.")
-                    disconnected_clients.append(client_id)
                 else:
                     logger.error(f"Runtime error broadcasting to WebSocket {client_id}: {e}")
-                    disconnected_clients.append(client_id)
+                return client_id
             except asyncio.CancelledError:
                 raise
             except Exception as e:
                 logger.error(f"Unknown error broadcasting to WebSocket {client_id}: {e}")
-                disconnected_clients.append(client_id)
+                return client_id
+            return None
+
+        if len(active_conns_copy) == 1:
+            # Usual case of a single log viewer: no gather bookkeeping needed
+            results = [await send_to_client(*active_conns_copy[0])]
+        else:
+            # Send to every client at once so one slow socket does not delay the rest
+            results = await asyncio.gather(
+                *(send_to_client(client_id, connection) for client_id, connection in active_conns_copy)
+            )
+        disconnected_clients: List[str] = [client_id for client_id in results if client_id]
         if disconnected_clients:
+            stale_connections = [
+                connection
+                for client_id, connection in active_conns_copy
+                if client_id in disconnected_clients
+            ]
             for client_id_to_remove in disconnected_clients:
                 self.disconnect(client_id_to_remove)
+            # Close dropped sockets in one pass so still-open clients notice and reconnect
+            await asyncio.gather(
+                *(connection.close() for connection in stale_connections),
+                return_exceptions=True,
+            )
+
+
+# Records waiting for the flush task; the oldest are dropped beyond this
+_WS_LOG_PENDING_MAX = 1000
 
 
 class WebSocketLogHandler(logging.Handler):
@@ -103,6 +141,8 @@ class WebSocketLogHandler(logging.Handler):
         super().__init__()
         self.manager = manager
         self.formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        self._pending: Deque[str] = deque(maxlen=_WS_LOG_PENDING_MAX)
+        self._flush_scheduled = False
 
     def emit(self, record: logging.LogRecord):
         if self.manager and self.manager.active_connections:
@@ -110,8 +150,20 @@ class WebSocketLogHandler(logging.Handler):
                 log_entry_str = self.format(record)
                 try:
                     current_loop = asyncio.get_running_loop()
-                    current_loop.create_task(self.manager.broadcast(log_entry_str))
                 except RuntimeError:
-                    pass
+                    return
+                self._pending.append(log_entry_str)
+                # One flush task drains a whole burst instead of one task per record
+                if not self._flush_scheduled:
+                    self._flush_scheduled = True
+                    current_loop.create_task(self._flush())
             except Exception as e:
                 print(f"WebSocketLogHandler Error: Failed to broadcast log - {e}", file=sys.__stderr__)
+
+    async def _flush(self):
+        # Records stay one frame each: the log viewer renders a frame as one entry
+        try:
+            while self._pending:
+                await self.manager.broadcast(self._pending.popleft())
+        finally:
+            self._flush_scheduled = False
@@ -73,6 +73,36 @@ async def test_chat_completions_service_unavailable():
     assert excinfo.value.status_code == 503
 
 
+@pytest.mark.asyncio
+async def test_chat_completions_queue_full():
+    request = ChatCompletionRequest(
+        messages=[Message(role="user", content="hello")], model="gpt-4"
+    )
+    request_queue = asyncio.Queue()
+    request_queue.put_nowait({"req_id": "queued"})
+    server_state = {
+        "is_initializing": False,
+        "is_playwright_ready": True,
+        "is_page_ready": True,
+        "is_browser_connected": True,
+    }
+    worker_task = MagicMock()
+    worker_task.done.return_value = False
+
+    with patch("api_utils.routers.chat.REQUEST_QUEUE_MAX_SIZE", 1):
+        with pytest.raises(HTTPException) as excinfo:
+            await chat_completions(
+                request=request,
+                http_request=MagicMock(),
+                logger=MagicMock(),
+                request_queue=request_queue,
+                server_state=server_state,
+                worker_task=worker_task,
+            )
+    assert excinfo.value.status_code == 429
+    assert request_queue.qsize() == 1
+
+
 @pytest.mark.asyncio
 async def test_chat_completions_timeout():
     # Mock asyncio.wait_for to raise TimeoutError immediately
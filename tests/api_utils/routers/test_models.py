@@ -360,3 +360,22 @@ async def test_list_models_empty_after_filtering(mock_env):
     # Verify: Return empty list (not fallback)
     assert response["object"] == "list"
     assert len(response["data"]) == 0
+
+
+def test_get_visible_models_reuses_result_until_inputs_change():
+    from api_utils.routers.models import _get_visible_models
+
+    parsed_model_list = [{"id": "a"}, {"id": "b"}]
+    excluded_model_ids = {"b"}
+
+    first = _get_visible_models(parsed_model_list, excluded_model_ids)
+    assert first == [{"id": "a"}]
+    assert _get_visible_models(parsed_model_list, excluded_model_ids) is first
+
+    # Exclusions grown in place are picked up
+    excluded_model_ids.add("a")
+    assert _get_visible_models(parsed_model_list, excluded_model_ids) == []
+
+    # A replaced model list is picked up
+    refreshed = [{"id": "a"}, {"id": "c"}]
+    assert _get_visible_models(refreshed, excluded_model_ids) == [{"id": "c"}]
@@ -8,12 +8,15 @@ from fastapi.testclient import TestClient
 from api_utils.app import (
     VERSION,
     APIKeyAuthMiddleware,
+    _configure_thread_pools,
     _initialize_browser_and_page,
     _initialize_globals,
     _initialize_proxy_settings,
     _setup_logging,
+    _shielded_close,
     _shutdown_resources,
     _start_stream_proxy,
+    _start_stream_proxy_and_playwright,
     create_app,
 )
 from api_utils.server_state import state
@@ -146,11 +149,15 @@ async def test_lifespan_startup_shutdown():
     with (
         patch("api_utils.app._setup_logging") as mock_setup_logging,
         patch("api_utils.app._initialize_globals") as mock_init_globals,
+        patch("api_utils.app._configure_thread_pools"),
         patch("api_utils.app._initialize_proxy_settings") as mock_init_proxy,
         patch("api_utils.app.load_excluded_models") as mock_load_models,
         patch(
             "api_utils.app._start_stream_proxy", new_callable=AsyncMock
         ) as mock_start_proxy,
+        patch(
+            "api_utils.app._start_playwright", new_callable=AsyncMock
+        ) as mock_start_playwright,
         patch(
             "api_utils.app._initialize_browser_and_page", new_callable=AsyncMock
         ) as mock_init_browser,
@@ -171,6 +178,7 @@ async def test_lifespan_startup_shutdown():
             mock_init_proxy.assert_called_once()
             mock_load_models.assert_called_once()
             mock_start_proxy.assert_called_once()
+            mock_start_playwright.assert_called_once()
             mock_init_browser.assert_called_once()
             # Check actual log messages from the implementation
             mock_logger.info.assert_any_call("Starting AI Studio Proxy Server...")
@@ -192,11 +200,15 @@ async def test_lifespan_startup_failure():
     with (
         patch("api_utils.app._setup_logging") as mock_setup_logging,
         patch("api_utils.app._initialize_globals"),
+        patch("api_utils.app._configure_thread_pools"),
         patch("api_utils.app._initialize_proxy_settings"),
         patch("api_utils.app.load_excluded_models"),
         patch(
             "api_utils.app._start_stream_proxy", side_effect=Exception("Startup failed")
         ),
+        patch(
+            "api_utils.app._start_playwright", new_callable=AsyncMock
+        ) as mock_start_playwright,
         patch(
             "api_utils.app._shutdown_resources", new_callable=AsyncMock
         ) as mock_shutdown,
@@ -213,6 +225,71 @@ async def test_lifespan_startup_failure():
         # Verify shutdown was called even after failure
         mock_shutdown.assert_called()
         mock_logger.critical.assert_called()
+        # Playwright start ran to completion alongside the failing proxy start
+        mock_start_playwright.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_shutdown_cancels_watchdog_before_cookie_save():
+    """The watchdog is already unwinding while cookies are saved on shutdown."""
+    from types import SimpleNamespace
+
+    app_mock = MagicMock()
+    app_mock.state = SimpleNamespace()
+    state.is_page_ready = True
+    state.logger = MagicMock()
+
+    events = []
+
+    async def watchdog():
+        try:
+            await asyncio.Event().wait()
+        finally:
+            events.append("watchdog unwound")
+
+    async def save_cookies():
+        await asyncio.sleep(0)
+        events.append("cookies saved")
+
+    original_watchdog = state.quota_watchdog
+    state.quota_watchdog = watchdog
+    try:
+        with (
+            patch("api_utils.app._setup_logging") as mock_setup_logging,
+            patch("api_utils.app._initialize_globals"),
+            patch("api_utils.app._configure_thread_pools"),
+            patch("api_utils.app._initialize_proxy_settings"),
+            patch("api_utils.app.load_excluded_models"),
+            patch("api_utils.app._start_stream_proxy", new_callable=AsyncMock),
+            patch("api_utils.app._start_playwright", new_callable=AsyncMock),
+            patch("api_utils.app._initialize_browser_and_page", new_callable=AsyncMock),
+            patch("api_utils.app._shutdown_resources", new_callable=AsyncMock),
+            patch("api_utils.queue_worker.queue_worker", new_callable=AsyncMock),
+            patch("api_utils.app.restore_original_streams"),
+            patch(
+                "browser_utils.cookie_refresh.start_periodic_refresh",
+                return_value=MagicMock(),
+            ),
+            patch(
+                "browser_utils.cookie_refresh.stop_periodic_refresh",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "browser_utils.cookie_refresh.save_cookies_on_shutdown",
+                side_effect=save_cookies,
+            ),
+        ):
+            mock_setup_logging.return_value = (MagicMock(), MagicMock())
+
+            from api_utils.app import lifespan
+
+            async with lifespan(app_mock):
+                await asyncio.sleep(0)
+    finally:
+        state.quota_watchdog = original_watchdog
+
+    assert events == ["watchdog unwound", "cookies saved"]
+    assert app_mock.state.watchdog_task.cancelled()
 
 
 # --- New Tests for Helper Functions ---
@@ -257,6 +334,23 @@ def test_initialize_globals():
         mock_init_keys.assert_called_once()
 
 
+async def test_configure_thread_pools():
+    """Test _configure_thread_pools raises both thread limits."""
+    import anyio.to_thread
+
+    loop = asyncio.get_running_loop()
+    with (
+        patch("api_utils.app.THREADPOOL_MAX_WORKERS", 123),
+        patch.object(loop, "set_default_executor") as mock_set_executor,
+    ):
+        _configure_thread_pools()
+
+    assert anyio.to_thread.current_default_thread_limiter().total_tokens == 123
+    executor = mock_set_executor.call_args[0][0]
+    assert executor._max_workers == 123
+    executor.shutdown(wait=False)
+
+
 def test_initialize_proxy_settings_no_port():
     """Test _initialize_proxy_settings when STREAM_PORT is 0."""
     state.PLAYWRIGHT_PROXY_SETTINGS = None
@@ -379,6 +473,48 @@ async def test_start_stream_proxy_unexpected_signal():
         )
 
 
+@pytest.mark.asyncio
+async def test_start_stream_proxy_and_playwright_run_concurrently():
+    """Test STREAM proxy and Playwright startup overlap instead of running serially."""
+    proxy_started = asyncio.Event()
+    playwright_started = asyncio.Event()
+
+    async def fake_proxy():
+        proxy_started.set()
+        await asyncio.wait_for(playwright_started.wait(), 1.0)
+
+    async def fake_playwright():
+        playwright_started.set()
+        await asyncio.wait_for(proxy_started.wait(), 1.0)
+
+    with (
+        patch("api_utils.app._start_stream_proxy", side_effect=fake_proxy),
+        patch("api_utils.app._start_playwright", side_effect=fake_playwright),
+    ):
+        await _start_stream_proxy_and_playwright()
+
+    assert proxy_started.is_set()
+    assert playwright_started.is_set()
+
+
+@pytest.mark.asyncio
+async def test_start_stream_proxy_and_playwright_reraises_after_both_finish():
+    """Test a proxy failure is raised only after Playwright startup has settled."""
+    with (
+        patch(
+            "api_utils.app._start_stream_proxy",
+            side_effect=RuntimeError("STREAM proxy failed to start in time."),
+        ),
+        patch(
+            "api_utils.app._start_playwright", new_callable=AsyncMock
+        ) as mock_start_playwright,
+    ):
+        with pytest.raises(RuntimeError, match="STREAM proxy failed"):
+            await _start_stream_proxy_and_playwright()
+
+    mock_start_playwright.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_initialize_browser_and_page_missing_endpoint():
     """Test _initialize_browser_and_page raises error if endpoint missing."""
@@ -619,6 +755,114 @@ async def test_shutdown_resources_queue_cleanup_error_handling():
     mock_stream_process.terminate.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_shutdown_resources_stream_proxy_stops_alongside_browser():
+    """Test the blocking STREAM proxy join does not hold up page/browser teardown."""
+    import threading
+
+    page_closed = threading.Event()
+
+    mock_stream_process = MagicMock()
+    mock_stream_process.is_alive.return_value = False
+    # join() only returns once the page has been closed on the event loop
+    mock_stream_process.join.side_effect = lambda timeout: page_closed.wait(timeout)
+    state.STREAM_PROCESS = mock_stream_process
+    state.page_instance = MagicMock()
+
+    async def close_page():
+        page_closed.set()
+
+    with patch("api_utils.app._close_page_logic", side_effect=close_page):
+        await asyncio.wait_for(_shutdown_resources(), 2.0)
+
+    assert page_closed.is_set()
+    assert state.STREAM_PROCESS is None
+    assert state.page_instance is None
+
+
+@pytest.mark.asyncio
+async def test_shutdown_resources_browser_close_survives_cancellation():
+    """Test a cancelled shutdown still lets the in-flight browser close finish."""
+    browser_closed = asyncio.Event()
+    stop_saw_browser_closed = []
+
+    async def slow_close():
+        await asyncio.sleep(0.1)
+        browser_closed.set()
+
+    async def stop():
+        stop_saw_browser_closed.append(browser_closed.is_set())
+
+    mock_browser = MagicMock()
+    mock_browser.is_connected.return_value = True
+    mock_browser.close = slow_close
+    state.browser_instance = mock_browser
+
+    mock_pw = MagicMock()
+    mock_pw.stop = AsyncMock(side_effect=stop)
+    state.playwright_manager = mock_pw
+
+    shutdown_task = asyncio.create_task(_shutdown_resources())
+    await asyncio.sleep(0.02)
+    shutdown_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await shutdown_task
+
+    await asyncio.wait_for(browser_closed.wait(), 1.0)
+    # Teardown carried on to the next step, but only once the browser closed
+    mock_pw.stop.assert_awaited_once()
+    assert stop_saw_browser_closed == [True]
+    assert state.browser_instance is None
+
+
+@pytest.mark.asyncio
+async def test_shutdown_resources_browser_close_timeout_does_not_hang():
+    """Test a stalled browser.close() is abandoned and Playwright still stops."""
+    hung = asyncio.Event()
+
+    async def hanging_close():
+        await hung.wait()
+
+    mock_browser = MagicMock()
+    mock_browser.is_connected.return_value = True
+    mock_browser.close = hanging_close
+    state.browser_instance = mock_browser
+
+    mock_pw = MagicMock()
+    mock_pw.stop = AsyncMock()
+    state.playwright_manager = mock_pw
+
+    with patch("api_utils.app._BROWSER_CLOSE_TIMEOUT_SECONDS", 0.05):
+        await asyncio.wait_for(_shutdown_resources(), 2.0)
+
+    mock_pw.stop.assert_awaited_once()
+    assert state.browser_instance is None
+    assert state.is_browser_connected is False
+
+
+@pytest.mark.asyncio
+async def test_shielded_close_consumes_late_failure():
+    """Test a close that fails after the caller was cancelled is not left unretrieved."""
+    release = asyncio.Event()
+
+    async def failing_close():
+        await release.wait()
+        raise RuntimeError("connection closed")
+
+    close_task = asyncio.ensure_future(failing_close())
+    caller = asyncio.create_task(_shielded_close(close_task))
+    await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    assert close_task.done()
+    # Retrieved by _shielded_close, so asyncio will not log it as unhandled
+    assert close_task._log_traceback is False
+
+
 @pytest.mark.asyncio
 async def test_shutdown_resources_no_process_no_queue():
     """Test _shutdown_resources handles case where process/queue don't exist.
@@ -648,9 +892,11 @@ async def test_lifespan_direct_debug_mode():
     with (
         patch("api_utils.app._setup_logging", return_value=(None, None)),
         patch("api_utils.app._initialize_globals"),
+        patch("api_utils.app._configure_thread_pools"),
         patch("api_utils.app._initialize_proxy_settings"),
         patch("api_utils.app.load_excluded_models"),
         patch("api_utils.app._start_stream_proxy", new_callable=AsyncMock),
+        patch("api_utils.app._start_playwright", new_callable=AsyncMock),
         patch("api_utils.app._initialize_browser_and_page", new_callable=AsyncMock),
         patch("api_utils.app._shutdown_resources", new_callable=AsyncMock),
         patch("api_utils.queue_worker", new_callable=AsyncMock),
@@ -677,9 +923,11 @@ async def test_lifespan_page_not_ready_error():
     with (
         patch("api_utils.app._setup_logging", return_value=(None, None)),
         patch("api_utils.app._initialize_globals"),
+        patch("api_utils.app._configure_thread_pools"),
         patch("api_utils.app._initialize_proxy_settings"),
         patch("api_utils.app.load_excluded_models"),
         patch("api_utils.app._start_stream_proxy", new_callable=AsyncMock),
+        patch("api_utils.app._start_playwright", new_callable=AsyncMock),
         patch("api_utils.app._initialize_browser_and_page", new_callable=AsyncMock),
         patch("api_utils.app._shutdown_resources", new_callable=AsyncMock),
         patch("api_utils.app.restore_original_streams"),
@@ -63,6 +63,25 @@ async def test_get_available_profiles_success(manager, mock_saved_auth_dir):
     assert profiles == sorted(profiles)
 
 
+@pytest.mark.asyncio
+async def test_get_available_profiles_skips_non_profile_entries(
+    manager, mock_saved_auth_dir
+):
+    """Only regular, non-hidden .json files are returned."""
+    (mock_saved_auth_dir / "b.json").touch()
+    (mock_saved_auth_dir / "a.json").touch()
+    (mock_saved_auth_dir / ".hidden.json").touch()
+    (mock_saved_auth_dir / "notes.txt").touch()
+    (mock_saved_auth_dir / "dir.json").mkdir()
+
+    profiles = await manager.get_available_profiles()
+
+    assert profiles == [
+        os.path.join(str(mock_saved_auth_dir), "a.json"),
+        os.path.join(str(mock_saved_auth_dir), "b.json"),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_get_next_profile_success(manager):
     """Test getting next profile successfully."""
@@ -1,3 +1,4 @@
+import hmac
 from unittest.mock import mock_open, patch
 
 from api_utils.auth_utils import (
@@ -21,6 +22,17 @@ def test_load_api_keys():
             assert len(API_KEYS) == 3
 
 
+def test_load_api_keys_with_comments_and_empty_lines():
+    """Test that comment and blank lines in the key file are not loaded as keys."""
+    mock_content = (
+        "# This is a comment\nkey1\n   \n  # indented comment\nkey2\n\nkey3\n"
+    )
+    with patch("builtins.open", mock_open(read_data=mock_content)):
+        with patch("os.path.exists", return_value=True):
+            load_api_keys()
+            assert API_KEYS == {"key1", "key2", "key3"}
+
+
 def test_initialize_keys_creates_file():
     """Test initialize_keys creates file if not exists."""
     with patch("os.path.exists", return_value=False):
@@ -39,3 +51,17 @@ def test_verify_api_key():
     API_KEYS.add("valid_key")
     assert verify_api_key("valid_key") is True
     assert verify_api_key("invalid_key") is False
+
+
+def test_verify_api_key_uses_constant_time_compare():
+    """Test that key verification goes through hmac.compare_digest."""
+    API_KEYS.clear()
+    API_KEYS.update({"valid_key", "clé_unicode"})
+    with patch(
+        "api_utils.auth_utils.hmac.compare_digest", wraps=hmac.compare_digest
+    ) as mock_compare:
+        assert verify_api_key("clé_unicode") is True
+        assert verify_api_key("valid_kex") is False
+
+    assert mock_compare.call_count >= 3
+    API_KEYS.clear()
@@ -1,11 +1,13 @@
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import HTTPException, Request
 
 from api_utils.client_connection import (
+    cancel_all_disconnect_tasks,
     check_client_connection,
+    enhanced_disconnect_monitor,
     setup_disconnect_monitoring,
 )
 from models import ClientDisconnectedError
@@ -16,12 +18,6 @@ async def test_check_client_connection_success():
     """Test successful client connection check."""
     req_id = "test_req"
     request = MagicMock(spec=Request)
-
-    # Mock _receive to return a non-disconnect message
-    async def mock_receive():
-        return {"type": "http.request"}
-
-    request._receive = mock_receive
     request.is_disconnected = AsyncMock(return_value=False)
 
     result = await check_client_connection(req_id, request)
@@ -33,12 +29,7 @@ async def test_check_client_connection_disconnected():
     """Test client connection check when disconnected."""
     req_id = "test_req"
     request = MagicMock(spec=Request)
-
-    # Mock _receive to return a disconnect message
-    async def mock_receive():
-        return {"type": "http.disconnect"}
-
-    request._receive = mock_receive
+    request.is_disconnected = AsyncMock(return_value=True)
 
     result = await check_client_connection(req_id, request)
     assert result is False
@@ -50,13 +41,12 @@ async def test_check_client_connection_timeout():
     req_id = "test_req"
     request = MagicMock(spec=Request)
 
-    # Mock _receive to hang
-    async def mock_receive():
+    # Mock is_disconnected to hang
+    async def mock_is_disconnected():
         await asyncio.sleep(1)
-        return {"type": "http.request"}
+        return True
 
-    request._receive = mock_receive
-    request.is_disconnected = AsyncMock(return_value=False)
+    request.is_disconnected = mock_is_disconnected
 
     # Should return True on timeout (assuming connected)
     result = await check_client_connection(req_id, request)
@@ -64,19 +54,55 @@ async def test_check_client_connection_timeout():
 
 
 @pytest.mark.asyncio
-async def test_check_client_connection_exception():
-    """Test client connection check exception."""
-    req_id = "test_req"
+async def test_check_client_connection_propagates_cancellation():
+    """Cancelling the caller must not be mistaken for a connected client."""
     request = MagicMock(spec=Request)
+    started = asyncio.Event()
 
-    # Mock _receive to raise exception
-    async def mock_receive():
-        raise Exception("Connection error")
+    async def mock_is_disconnected():
+        started.set()
+        await asyncio.sleep(0)
+        await asyncio.Event().wait()
 
-    request._receive = mock_receive
+    request.is_disconnected = mock_is_disconnected
+
+    task = asyncio.create_task(check_client_connection("test_req", request))
+    await started.wait()
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_enhanced_disconnect_monitor_propagates_cancellation():
+    """A cancelled monitor unwinds instead of returning normally."""
+    request = MagicMock(spec=Request)
+    request.is_disconnected = AsyncMock(return_value=False)
+    completion_event = asyncio.Event()
+
+    task = asyncio.create_task(
+        enhanced_disconnect_monitor("test_req", request, completion_event, MagicMock())
+    )
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert not completion_event.is_set()
+
+
+@pytest.mark.asyncio
+async def test_check_client_connection_ignores_receive():
+    """Test that the private _receive channel is never consumed."""
+    req_id = "test_req"
+    request = MagicMock(spec=Request)
+    request._receive = AsyncMock(return_value={"type": "http.disconnect"})
+    request.is_disconnected = AsyncMock(return_value=False)
 
     result = await check_client_connection(req_id, request)
-    assert result is False
+    assert result is True
+    request._receive.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -87,68 +113,45 @@ async def test_setup_disconnect_monitoring_active_disconnect():
     request.is_disconnected = AsyncMock(return_value=True)
     result_future = asyncio.Future()
 
-    # Mock check_client_connection to return False (disconnected)
-    with patch(
-        "api_utils.client_connection.check_client_connection", new_callable=AsyncMock
-    ) as mock_test:
-        mock_test.return_value = False
+    event, task, check_func = await setup_disconnect_monitoring(
+        req_id, request, result_future
+    )
 
-        event, task, check_func = await setup_disconnect_monitoring(
-            req_id, request, result_future
-        )
+    # The poller returns on the first disconnect signal
+    await asyncio.sleep(0.05)
 
-        # Wait for task to process (threshold is 5 consecutive checks at 0.3s each)
-        await asyncio.sleep(2.0)
+    assert event.is_set()
+    assert result_future.done()
+    with pytest.raises(HTTPException) as exc:
+        result_future.result()
+    assert exc.value.status_code == 499
 
-        assert event.is_set()
-        assert result_future.done()
-        with pytest.raises(HTTPException) as exc:
-            result_future.result()
-        assert exc.value.status_code == 499
+    # Verify check function raises error
+    with pytest.raises(ClientDisconnectedError):
+        check_func("test_stage")
 
-        # Verify check function raises error
-        with pytest.raises(ClientDisconnectedError):
-            check_func("test_stage")
-
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+    assert task.done()
 
 
 @pytest.mark.asyncio
-async def test_setup_disconnect_monitoring_passive_disconnect():
-    """Test disconnect monitoring when client passively disconnects (is_disconnected)."""
+async def test_setup_disconnect_monitoring_delayed_disconnect():
+    """Test disconnect monitoring when the client disconnects after a few polls."""
     req_id = "test_req"
     request = MagicMock(spec=Request)
-    request.is_disconnected = AsyncMock(return_value=True)
+    request.is_disconnected = AsyncMock(side_effect=[False, True])
     result_future = asyncio.Future()
 
-    # Mock check_client_connection to return False, simulating that it detected the disconnect.
-    with patch(
-        "api_utils.client_connection.check_client_connection", new_callable=AsyncMock
-    ) as mock_test:
-        mock_test.return_value = False
-
-        event, task, check_func = await setup_disconnect_monitoring(
-            req_id, request, result_future
-        )
+    event, task, check_func = await setup_disconnect_monitoring(
+        req_id, request, result_future
+    )
+    await task
+    await asyncio.sleep(0)
 
-        # Wait for task to process (threshold is 5 consecutive checks at 0.3s each)
-        await asyncio.sleep(2.0)
-
-        assert event.is_set()
-        assert result_future.done()
-        with pytest.raises(HTTPException) as exc:
-            result_future.result()
-        assert exc.value.status_code == 499
-
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+    assert request.is_disconnected.await_count == 2
+    assert event.is_set()
+    with pytest.raises(HTTPException) as exc:
+        result_future.result()
+    assert exc.value.status_code == 499
 
 
 @pytest.mark.asyncio
@@ -156,31 +159,21 @@ async def test_setup_disconnect_monitoring_exception():
     """Test disconnect monitoring handles exceptions."""
     req_id = "test_req"
     request = MagicMock(spec=Request)
+    request.is_disconnected = AsyncMock(side_effect=Exception("Monitor error"))
     result_future = asyncio.Future()
 
-    # Mock check_client_connection to raise exception
-    with patch(
-        "api_utils.client_connection.check_client_connection",
-        side_effect=Exception("Monitor error"),
-    ):
-        event, task, check_func = await setup_disconnect_monitoring(
-            req_id, request, result_future
-        )
+    event, task, check_func = await setup_disconnect_monitoring(
+        req_id, request, result_future
+    )
 
-        # Wait for task to process
-        await asyncio.sleep(0.1)
+    # Wait for task to process
+    await asyncio.sleep(0.1)
 
-        assert event.is_set()
-        assert result_future.done()
-        with pytest.raises(HTTPException) as exc:
-            result_future.result()
-        assert exc.value.status_code == 500
-
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+    assert event.is_set()
+    assert result_future.done()
+    with pytest.raises(HTTPException) as exc:
+        result_future.result()
+    assert exc.value.status_code == 500
 
 
 # ============================================================================
@@ -189,27 +182,17 @@ async def test_setup_disconnect_monitoring_exception():
 
 
 @pytest.mark.asyncio
-async def test_check_client_connection_via_is_disconnected():
+async def test_check_client_connection_sync_is_disconnected():
     """
-    Test scenario: _receive timeout, but is_disconnected() returns True
-    Expected: Return False (line 47)
+    Test scenario: is_disconnected() is a plain function returning True
+    Expected: Return False
     """
     req_id = "test_req"
     request = MagicMock(spec=Request)
+    request.is_disconnected = MagicMock(return_value=True)
 
-    # _receive does not return disconnect immediately, but times out
-    async def mock_receive():
-        await asyncio.sleep(1)  # Will timeout in check
-        return {"type": "http.request"}
-
-    request._receive = mock_receive
-    # is_disconnected() returns True
-    request.is_disconnected = AsyncMock(return_value=True)
-
-    # Execute
     result = await check_client_connection(req_id, request)
 
-    # Verify: Return False (line 47 executed)
     assert result is False
 
 
@@ -221,14 +204,6 @@ async def test_check_client_connection_outer_exception():
     """
     req_id = "test_req"
     request = MagicMock(spec=Request)
-
-    # _receive timeout
-    async def mock_receive():
-        await asyncio.sleep(1)
-        return {"type": "http.request"}
-
-    request._receive = mock_receive
-    # is_disconnected() throws exception
     request.is_disconnected = AsyncMock(side_effect=Exception("is_disconnected error"))
 
     # Execute and verify exception is re-raised
@@ -245,95 +220,64 @@ async def test_check_client_connection_outer_exception():
 async def test_setup_disconnect_monitoring_client_stays_connected():
     """
     Test scenario: Client stays connected, result_future completed by other task
-    Expected: Monitoring task loops normally, executes sleep
+    Expected: Poller keeps polling and never touches the future or the event
     """
     req_id = "test_req"
     request = MagicMock(spec=Request)
     request.is_disconnected = AsyncMock(return_value=False)
     result_future = asyncio.Future()
 
-    # Track check calls
-    check_count = 0
-
-    async def mock_check_connected(*args, **kwargs):
-        nonlocal check_count
-        check_count += 1
-        if check_count >= 3:
-            # Complete the future to stop the loop
-            if not result_future.done():
-                result_future.set_result({"status": "success"})
-        return True  # Client stays connected
-
-    with patch(
-        "api_utils.client_connection.check_client_connection",
-        new_callable=AsyncMock,
-        side_effect=mock_check_connected,
-    ):
-        event, task, check_func = await setup_disconnect_monitoring(
-            req_id, request, result_future
-        )
+    event, task, check_func = await setup_disconnect_monitoring(
+        req_id, request, result_future
+    )
 
-        # Wait for multiple checks (0.3s sleep each in the monitoring loop)
-        await asyncio.sleep(1.2)
+    # Wait for multiple checks (1s sleep each in the poller)
+    await asyncio.sleep(1.2)
+    result_future.set_result({"status": "success"})
 
-        # Verify: Multiple checks performed
-        assert check_count >= 3
+    # Verify: Multiple checks performed
+    assert request.is_disconnected.await_count >= 2
 
-        # Verify: future completed normally
-        assert result_future.done()
-        assert result_future.result() == {"status": "success"}
+    # Verify: future completed normally
+    assert result_future.result() == {"status": "success"}
 
-        # Verify: event not set (no disconnect)
-        assert not event.is_set()
+    # Verify: event not set (no disconnect)
+    assert not event.is_set()
 
-        # Cleanup
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+    # Cleanup
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
 
 
 @pytest.mark.asyncio
 async def test_setup_disconnect_monitoring_task_cancelled():
     """
     Test scenario: Monitoring task cancelled
-    Expected: CancelledError caught, task exits gracefully
+    Expected: Task cancelled without flagging a disconnect
     """
     req_id = "test_req"
     request = MagicMock(spec=Request)
     request.is_disconnected = AsyncMock(return_value=False)
     result_future = asyncio.Future()
 
-    # Mock check to return True (connected), so it enters the sleep
-    with patch(
-        "api_utils.client_connection.check_client_connection",
-        new_callable=AsyncMock,
-        return_value=True,
-    ):
-        event, task, check_func = await setup_disconnect_monitoring(
-            req_id, request, result_future
-        )
+    event, task, check_func = await setup_disconnect_monitoring(
+        req_id, request, result_future
+    )
 
-        # Give it time to start one check cycle
-        await asyncio.sleep(0.1)
+    # Give it time to start one check cycle
+    await asyncio.sleep(0.1)
 
-        # Execute: Cancel task
-        task.cancel()
+    # Execute: Cancel task
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
 
-        # Verify: Task cancelled
-        # Task catches CancelledError and exits gracefully, will not re-throw
-        try:
-            await task
-        except asyncio.CancelledError:
-            # If it does raise, that's also fine
-            pass
-
-        # Verify: Task done
-        assert task.done()
-
-        # Verify: event not set (task cancelled, not disconnect)
-        assert not event.is_set()
+    # Verify: event not set (task cancelled, not disconnect)
+    assert not event.is_set()
+    assert not result_future.done()
 
 
 @pytest.mark.asyncio
@@ -347,31 +291,44 @@ async def test_check_client_disconnected_not_disconnected():
     request.is_disconnected = AsyncMock(return_value=False)
     result_future = asyncio.Future()
 
-    # Mock check to keep client connected
-    with patch(
-        "api_utils.client_connection.check_client_connection",
-        new_callable=AsyncMock,
-        return_value=True,
-    ):
-        event, task, check_func = await setup_disconnect_monitoring(
-            req_id, request, result_future
-        )
-
-        # Wait a bit but don't let it disconnect
-        await asyncio.sleep(0.1)
-
-        # Execute: Call check function
-        result = check_func("test_stage")
-
-        # Verify: Return False, no exception thrown
-        assert result is False
-
-        # Verify: event not set
-        assert not event.is_set()
-
-        # Cleanup
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
+    event, task, check_func = await setup_disconnect_monitoring(
+        req_id, request, result_future
+    )
+
+    # Wait a bit but don't let it disconnect
+    await asyncio.sleep(0.1)
+
+    # Execute: Call check function
+    result = check_func("test_stage")
+
+    # Verify: Return False, no exception thrown
+    assert result is False
+
+    # Verify: event not set
+    assert not event.is_set()
+
+    # Cleanup
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_cancel_all_disconnect_tasks():
+    """Pollers left running by unfinished requests are cancelled in bulk."""
+    request = MagicMock(spec=Request)
+    request.is_disconnected = AsyncMock(return_value=False)
+    futures = [asyncio.Future(), asyncio.Future()]
+
+    tasks = [
+        (await setup_disconnect_monitoring(f"req_{i}", request, fut))[1]
+        for i, fut in enumerate(futures)
+    ]
+    await asyncio.sleep(0.05)
+
+    await cancel_all_disconnect_tasks()
+
+    assert all(task.cancelled() for task in tasks)
+    assert not any(fut.done() for fut in futures)
@@ -220,3 +220,27 @@ def test_get_current_ai_studio_model_id_none():
 
         # Verify: Return None
         assert result is None
+
+
+async def test_ensure_request_lock_wakes_on_quota_reset():
+    """
+    Test scenario: Quota exceeded, watchdog not yet recovering
+    Expected: Parked request resumes as soon as the quota is reset, without polling
+    """
+    import asyncio
+
+    from api_utils.dependencies import ensure_request_lock
+    from config.global_state import GlobalState
+
+    GlobalState.set_quota_exceeded("quota")
+    assert not GlobalState.QUOTA_RESET_EVENT.is_set()
+
+    parked = asyncio.create_task(ensure_request_lock())
+    await asyncio.sleep(0.05)
+    assert not parked.done()
+    assert GlobalState.queued_request_count == 1
+
+    GlobalState.reset_quota_status()
+    await asyncio.wait_for(parked, 0.5)
+
+    assert GlobalState.queued_request_count == 0
@@ -236,3 +236,17 @@ def test_error_with_special_characters():
 
     assert result.status_code == 400
     assert 'Invalid JSON: unexpected "quote"' in result.detail
+
+
+def test_queue_full():
+    """
+    Test scenario: Request queue at capacity
+    Verify: 429 status code and Retry-After header
+    """
+    from api_utils.error_utils import queue_full
+
+    result = queue_full(req_id="req909")
+
+    assert result.status_code == 429
+    assert result.detail == "[req909] Request queue is full. Please try again later."
+    assert result.headers == {"Retry-After": "10"}
@@ -173,6 +173,33 @@ class TestAnalyzeModelRequirements:
 
         assert result["model_id_to_use"] == "any-model"
 
+    @pytest.mark.asyncio
+    async def test_valid_model_ids_refresh_when_list_replaced(
+        self, make_request_context
+    ):
+        """Test that the cached id set follows replacement of the model list."""
+        req_id = "test-req"
+        context = make_request_context(
+            current_ai_studio_model_id="gemini-1.5-pro",
+            parsed_model_list=[{"id": "gemini-1.5-pro"}],
+        )
+
+        with pytest.raises(HTTPException):
+            await analyze_model_requirements(
+                req_id, context, "gemini-2.0-flash", "proxy-model"
+            )
+
+        context["parsed_model_list"] = [
+            {"id": "gemini-1.5-pro"},
+            {"id": "gemini-2.0-flash"},
+        ]
+        result = await analyze_model_requirements(
+            req_id, context, "gemini-2.0-flash", "proxy-model"
+        )
+
+        assert result["model_id_to_use"] == "gemini-2.0-flash"
+        assert result["needs_model_switching"] is True
+
 
 class TestHandleModelSwitching:
     """Tests for handle_model_switching function."""
@@ -318,6 +345,35 @@ class TestHandleModelSwitching:
             # Restore original state
             state.current_ai_studio_model_id = original_model
 
+    @pytest.mark.asyncio
+    async def test_already_switched_model_skips_lock(
+        self, real_locks_mock_browser, make_request_context
+    ):
+        """Test that an already-correct model returns without taking the lock."""
+        req_id = "test-req"
+        lock = real_locks_mock_browser.model_switching_lock
+
+        original_model = state.current_ai_studio_model_id
+        try:
+            state.current_ai_studio_model_id = "gemini-1.5-flash"
+
+            context = make_request_context(
+                current_ai_studio_model_id="gemini-1.5-pro",
+                model_switching_lock=lock,
+            )
+            context["needs_model_switching"] = True
+            context["model_id_to_use"] = "gemini-1.5-flash"
+
+            # Would block forever if the lock were acquired
+            async with lock:
+                result = await asyncio.wait_for(
+                    handle_model_switching(req_id, context), 1.0
+                )
+
+            assert not result.get("model_actually_switched", False)
+        finally:
+            state.current_ai_studio_model_id = original_model
+
 
 class TestHandleParameterCache:
     """Tests for handle_parameter_cache function."""
@@ -399,6 +455,30 @@ class TestHandleParameterCache:
             == "gemini-1.5-pro"
         )
 
+    @pytest.mark.asyncio
+    async def test_cache_fast_path_skips_lock(
+        self, real_locks_mock_browser, make_request_context
+    ):
+        """Test that an up-to-date cache is read without taking the lock."""
+        req_id = "test-req"
+        lock = real_locks_mock_browser.params_cache_lock
+
+        context = make_request_context(
+            current_ai_studio_model_id="gemini-1.5-pro",
+            params_cache_lock=lock,
+        )
+        context["model_actually_switched"] = False
+        context["page_params_cache"] = {
+            "temperature": 0.7,
+            "last_known_model_id_for_params": "gemini-1.5-pro",
+        }
+
+        # Would block forever if the lock were acquired
+        async with lock:
+            await asyncio.wait_for(handle_parameter_cache(req_id, context), 1.0)
+
+        assert context["page_params_cache"]["temperature"] == 0.7
+
     @pytest.mark.asyncio
     async def test_cache_uses_real_lock(self, real_locks_mock_browser):
         """Test that parameter cache uses real asyncio.Lock."""
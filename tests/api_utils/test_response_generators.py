@@ -20,6 +20,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from api_utils.response_generators import (
+    _wait_for_state_event,
     gen_sse_from_aux_stream,
     gen_sse_from_playwright,
 )
@@ -1160,3 +1161,34 @@ async def test_gen_sse_from_aux_stream_list_instead_of_dict(
 
     # Should skip list data and process valid dict
     assert any("OK" in c for c in chunks)
+
+
+class TestWaitForStateEvent:
+    """Tests for the heartbeat wait used while recovery or quota blocks a stream."""
+
+    @pytest.mark.asyncio
+    async def test_returns_as_soon_as_event_is_set(self):
+        event = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.01, event.set)
+
+        start = asyncio.get_running_loop().time()
+        await _wait_for_state_event(event, timeout=5.0)
+
+        assert asyncio.get_running_loop().time() - start < 1.0
+
+    @pytest.mark.asyncio
+    async def test_times_out_without_raising(self):
+        await _wait_for_state_event(asyncio.Event(), timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_already_set_event_still_waits(self):
+        """A stale set event must not turn the caller's loop into a busy spin."""
+        event = asyncio.Event()
+        event.set()
+
+        with patch(
+            "api_utils.response_generators.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            await _wait_for_state_event(event, timeout=1.0)
+
+        mock_sleep.assert_awaited_once_with(1.0)
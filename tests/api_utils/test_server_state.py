@@ -42,6 +42,22 @@ def test_clear_debug_logs(fresh_state):
     assert fresh_state.network_log == {"requests": [], "responses": []}
 
 
+def test_invalidate_params_cache(fresh_state):
+    """
+    Test scenario: Page reloaded or re-navigated
+    Expected: cached UI parameters are dropped, the lock is untouched
+    """
+    lock = fresh_state.params_cache_lock
+    fresh_state.page_params_cache.update(
+        {"temperature": 0.5, "last_known_model_id_for_params": "gemini-pro"}
+    )
+
+    fresh_state.invalidate_params_cache()
+
+    assert fresh_state.page_params_cache == {}
+    assert fresh_state.params_cache_lock is lock
+
+
 def test_module_getattr_success():
     """
     Test scenario: Access state attribute using __getattr__
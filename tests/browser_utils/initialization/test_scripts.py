@@ -2,12 +2,16 @@
 Tests for browser_utils/initialization/scripts.py
 """
 
+import os
 from unittest.mock import AsyncMock, mock_open, patch
 
 import pytest
 
 from browser_utils.initialization.scripts import (
+    _USERSCRIPT_CACHE,
+    _USERSCRIPT_CACHE_MAX_ENTRIES,
     _clean_userscript_headers,
+    _load_cleaned_userscript,
     add_init_scripts_to_context,
 )
 
@@ -280,3 +284,40 @@ console.log('hello, world! 🌍');"""
         # Verify large file correctly handled
         assert "console.log('line');" in called_script
         assert called_script.count("console.log('line');") == 10000
+
+
+class TestLoadCleanedUserscript:
+    """Test _load_cleaned_userscript caching"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        _USERSCRIPT_CACHE.clear()
+        yield
+        _USERSCRIPT_CACHE.clear()
+
+    def test_reuses_cleaned_script_until_file_changes(self, tmp_path):
+        script_path = tmp_path / "script.js"
+        script_path.write_text(
+            "// ==UserScript==\n// @name Test\n// ==/UserScript==\nconsole.log(1);",
+            encoding="utf-8",
+        )
+
+        first = _load_cleaned_userscript(str(script_path))
+        assert first == "console.log(1);"
+
+        with patch("browser_utils.initialization.scripts.open") as mock_file:
+            assert _load_cleaned_userscript(str(script_path)) == first
+        mock_file.assert_not_called()
+
+        script_path.write_text("console.log(2);", encoding="utf-8")
+        stat = script_path.stat()
+        os.utime(script_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert _load_cleaned_userscript(str(script_path)) == "console.log(2);"
+
+    def test_cache_is_bounded(self, tmp_path):
+        for i in range(_USERSCRIPT_CACHE_MAX_ENTRIES + 2):
+            script_path = tmp_path / f"script{i}.js"
+            script_path.write_text(f"console.log({i});", encoding="utf-8")
+            _load_cleaned_userscript(str(script_path))
+
+        assert len(_USERSCRIPT_CACHE) == _USERSCRIPT_CACHE_MAX_ENTRIES
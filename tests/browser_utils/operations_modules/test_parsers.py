@@ -245,6 +245,37 @@ async def test_handle_model_list_response_invalid_model_id(mock_state):
     assert mock_state.parsed_model_list[0]["id"] == "valid-id"
 
 
+@pytest.mark.asyncio
+@patch(
+    "browser_utils.operations_modules.parsers.MODELS_ENDPOINT_URL_CONTAINS", "models"
+)
+@patch("api_utils.server_state.state")
+async def test_handle_model_list_response_invalid_json_logs_preview(mock_state):
+    """Test invalid JSON logs a bounded preview of the raw body."""
+    import asyncio
+    import json
+
+    mock_state.parsed_model_list = []
+    mock_state.excluded_model_ids = set()
+    mock_state.is_page_ready = True
+    mock_state.model_list_fetch_event = AsyncMock(spec=asyncio.Event)
+    mock_state.model_list_fetch_event.is_set.return_value = False
+
+    response = AsyncMock()
+    response.url = "https://example.com/models"
+    response.ok = True
+    response.json.side_effect = json.JSONDecodeError("Expecting value", "x", 0)
+    response.body.return_value = b"\xff" + b"x" * 1000
+
+    with patch("browser_utils.operations_modules.parsers.logger") as mock_logger:
+        await _handle_model_list_response(response)
+
+    message = mock_logger.error.call_args[0][0]
+    assert message.endswith("�" + "x" * 499)
+    response.text.assert_not_called()
+    assert mock_state.model_list_fetch_event.set.called
+
+
 @pytest.mark.asyncio
 @patch("browser_utils.operations_modules.parsers.os.environ.get", return_value="debug")
 @patch(
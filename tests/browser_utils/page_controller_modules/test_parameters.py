@@ -77,6 +77,24 @@ async def test_adjust_temperature_cache_hit(
     assert page_params_cache["temperature"] == 0.7
 
 
+@pytest.mark.asyncio
+async def test_adjust_temperature_cache_hit_skips_lock(
+    controller, mock_lock, mock_check_disconnect, mock_page
+):
+    page_params_cache = {"temperature": 0.7}
+
+    # Would block forever if the lock were acquired
+    async with mock_lock:
+        await asyncio.wait_for(
+            controller._adjust_temperature(
+                0.7, page_params_cache, mock_lock, mock_check_disconnect
+            ),
+            1.0,
+        )
+
+    mock_page.locator.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_adjust_temperature_update_success(
     controller, mock_lock, mock_check_disconnect, mock_page
@@ -587,6 +605,24 @@ async def test_adjust_max_tokens_cache_hit(
     assert page_params_cache["max_output_tokens"] == 2048
 
 
+@pytest.mark.asyncio
+async def test_adjust_max_tokens_cache_hit_skips_lock(
+    controller, mock_lock, mock_check_disconnect, mock_page
+):
+    page_params_cache = {"max_output_tokens": 2048}
+
+    # Would block forever if the lock were acquired
+    async with mock_lock:
+        await asyncio.wait_for(
+            controller._adjust_max_tokens(
+                2048, page_params_cache, mock_lock, None, [], mock_check_disconnect
+            ),
+            1.0,
+        )
+
+    mock_page.locator.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_adjust_max_tokens_page_already_matches(
     controller, mock_lock, mock_check_disconnect, mock_page
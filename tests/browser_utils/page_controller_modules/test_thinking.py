@@ -118,6 +118,47 @@ async def test_has_thinking_dropdown(mock_controller, mock_page):
 # --- _handle_thinking_budget Logic Tests ---
 
 
+@pytest.mark.asyncio
+async def test_handle_thinking_budget_cache_hit_skips_lock(mock_controller):
+    mock_controller.params_cache["reasoning_effort"] = "high"
+    mock_controller._has_thinking_dropdown = AsyncMock()
+
+    # Would block forever if the lock were acquired
+    async with mock_controller.cache_lock:
+        await asyncio.wait_for(
+            mock_controller._handle_thinking_budget(
+                {"reasoning_effort": "high"},
+                mock_controller.params_cache,
+                mock_controller.cache_lock,
+                "gemini-2.5-pro",
+                MagicMock(return_value=False),
+            ),
+            1.0,
+        )
+
+    mock_controller._has_thinking_dropdown.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_handle_thinking_budget_non_thinking_skips_lock(mock_controller):
+    mock_controller._has_thinking_dropdown = AsyncMock()
+
+    async with mock_controller.cache_lock:
+        await asyncio.wait_for(
+            mock_controller._handle_thinking_budget(
+                {"reasoning_effort": "high"},
+                mock_controller.params_cache,
+                mock_controller.cache_lock,
+                "gemma-3-27b-it",
+                MagicMock(return_value=False),
+            ),
+            1.0,
+        )
+
+    mock_controller._has_thinking_dropdown.assert_not_called()
+    assert mock_controller.params_cache["reasoning_effort"] == "high"
+
+
 @pytest.mark.asyncio
 async def test_handle_thinking_budget_disabled(mock_controller):
     # Mock helpers - THINKING_FLASH category
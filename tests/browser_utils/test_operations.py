@@ -141,6 +141,19 @@ async def test_handle_model_list_response_success():
     await _handle_model_list_response(response)
 
 
+@pytest.mark.asyncio
+async def test_handle_model_list_response_ignores_other_urls_without_state():
+    """Non-model-list responses return before server state is touched."""
+    response = MagicMock()
+    response.url = "https://aistudio.google.com/static/app.js"
+    response.json = AsyncMock()
+
+    with patch("api_utils.server_state.state", new=object()):
+        await _handle_model_list_response(response)
+
+    response.json.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_detect_and_extract_page_error_found(mock_page):
     """Test detecting page error."""
@@ -129,6 +129,88 @@ class TestFindFirstVisibleLocator:
             assert locator is mock_locator2
             assert selector == "sel2"
 
+    @staticmethod
+    def _expect_by_selector(behaviours):
+        """Build an expect() stand-in whose to_be_visible runs behaviours[selector]."""
+
+        def fake_expect(locator):
+            selector = locator.selector
+
+            async def to_be_visible(timeout):
+                await behaviours[selector]()
+
+            assertions = MagicMock()
+            assertions.to_be_visible = to_be_visible
+            return assertions
+
+        return fake_expect
+
+    @staticmethod
+    def _page():
+        page = MagicMock()
+
+        def make_locator(selector):
+            locator = MagicMock()
+            locator.selector = selector
+            return locator
+
+        page.locator.side_effect = make_locator
+        return page
+
+    @pytest.mark.asyncio
+    async def test_fallbacks_are_awaited_concurrently(self):
+        """Fallback waits overlap instead of running one after another."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_fail():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            raise Exception("Timeout")
+
+        async def fail():
+            raise Exception("Timeout")
+
+        behaviours = {"sel1": fail, "sel2": slow_fail, "sel3": slow_fail}
+        with patch(
+            "playwright.async_api.expect",
+            side_effect=self._expect_by_selector(behaviours),
+        ):
+            locator, selector = await find_first_visible_locator(
+                self._page(), ["sel1", "sel2", "sel3"], "test element"
+            )
+
+        assert (locator, selector) == (None, None)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_fallback_priority_wins_over_faster_match(self):
+        """A higher-priority fallback is returned even if a later one is visible first."""
+
+        async def fail():
+            raise Exception("Timeout")
+
+        async def slow_ok():
+            await asyncio.sleep(0.01)
+
+        async def ok():
+            return None
+
+        behaviours = {"sel1": fail, "sel2": slow_ok, "sel3": ok}
+        with patch(
+            "playwright.async_api.expect",
+            side_effect=self._expect_by_selector(behaviours),
+        ):
+            locator, selector = await find_first_visible_locator(
+                self._page(), ["sel1", "sel2", "sel3"], "test element"
+            )
+
+        assert selector == "sel2"
+        assert locator.selector == "sel2"
+
     @pytest.mark.asyncio
     async def test_return_none_when_none_visible(self):
         """Should return None when no selector finds visible element."""
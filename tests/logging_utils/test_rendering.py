@@ -11,6 +11,7 @@ Covers:
 
 import logging
 import sys
+import time
 from unittest.mock import patch
 
 from logging_utils.core.rendering import (
@@ -18,6 +19,7 @@ from logging_utils.core.rendering import (
     GridFormatter,
     PlainGridFormatter,
     SemanticHighlighter,
+    format_clock,
     normalize_source,
 )
 
@@ -45,6 +47,29 @@ class TestNormalizeSource:
         assert result == "AB   "
 
 
+class TestFormatClock:
+    """Tests for format_clock function."""
+
+    def test_formats_local_time_with_millis(self):
+        """Test HH:MM:SS.mmm output for a given timestamp."""
+        created = 1_700_000_000.25
+        expected = time.strftime("%H:%M:%S", time.localtime(1_700_000_000)) + ".250"
+        assert format_clock(created) == expected
+
+    def test_same_second_reuses_cached_clock(self):
+        """Test that strftime runs once per second, not once per call."""
+        with patch(
+            "logging_utils.core.rendering.time.strftime", wraps=time.strftime
+        ) as mock_strftime:
+            first = format_clock(1_700_000_100.25)
+            second = format_clock(1_700_000_100.75)
+            third = format_clock(1_700_000_101.5)
+
+        assert mock_strftime.call_count == 2
+        assert first[:8] == second[:8]
+        assert (first[-3:], second[-3:], third[-3:]) == ("250", "750", "500")
+
+
 class TestSemanticHighlighter:
     """Tests for SemanticHighlighter."""
 
@@ -212,6 +237,8 @@ class TestPlainGridFormatter:
         assert "\x1b[" not in result
         assert "INF" in result
         assert "Plain message" in result
+        # Timestamp is the record's creation time, not the format time
+        assert result.startswith(format_clock(record.created))
 
     def test_format_skips_separator_lines(self):
         """Test that separator lines are skipped."""
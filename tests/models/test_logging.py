@@ -10,6 +10,7 @@ Targets:
 Coverage target: 70-80% (40-50 statements out of 57 missing)
 """
 
+import asyncio
 import json
 import logging
 from unittest.mock import AsyncMock, MagicMock, call, patch
@@ -96,6 +97,22 @@ def test_streamtologger_write_carriage_return():
     assert stream.linebuf == ""
 
 
+def test_streamtologger_write_lines_with_trailing_partial():
+    """Complete lines are logged and only the trailing partial is buffered."""
+    logger = MagicMock()
+    stream = StreamToLogger(logger, log_level=logging.INFO)
+
+    stream.write("buffered ")
+    stream.write("one\r\ntwo\n\nthree")
+
+    assert logger.log.call_args_list == [
+        call(logging.INFO, "buffered one"),
+        call(logging.INFO, "two"),
+        call(logging.INFO, ""),
+    ]
+    assert stream.linebuf == "three"
+
+
 def test_streamtologger_write_exception():
     """Test exception handling during write."""
     logger = MagicMock()
@@ -172,10 +189,7 @@ async def test_websocketmanager_connect_success():
     manager = WebSocketConnectionManager()
     ws = AsyncMock(spec=WebSocket)
 
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch("models.logging.logger") as mock_logger:
         await manager.connect("client1", ws)
 
     ws.accept.assert_called_once()
@@ -199,10 +213,7 @@ async def test_websocketmanager_connect_send_exception():
     ws = AsyncMock(spec=WebSocket)
     ws.send_text.side_effect = Exception("Send failed")
 
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch("models.logging.logger") as mock_logger:
         await manager.connect("client2", ws)
 
     # Connection should still be stored
@@ -218,10 +229,7 @@ def test_websocketmanager_disconnect_existing():
     ws = MagicMock()
     manager.active_connections["client1"] = ws
 
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch("models.logging.logger") as mock_logger:
         manager.disconnect("client1")
 
     assert "client1" not in manager.active_connections
@@ -232,10 +240,7 @@ def test_websocketmanager_disconnect_nonexistent():
     """Test disconnecting a non-existent client (should do nothing)."""
     manager = WebSocketConnectionManager()
 
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch("models.logging.logger") as mock_logger:
         manager.disconnect("nonexistent")
 
     # Should not log (client not found)
@@ -258,16 +263,33 @@ async def test_websocketmanager_broadcast_single_client():
     ws = AsyncMock(spec=WebSocket)
     manager.active_connections["client1"] = ws
 
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch("models.logging.logger"):
         await manager.broadcast("Test message")
 
     ws.send_text.assert_called_once_with("Test message")
     assert "client1" in manager.active_connections  # Not disconnected
 
 
+@pytest.mark.asyncio
+async def test_websocketmanager_broadcast_single_client_skips_gather():
+    """A single client is sent to directly, without asyncio.gather."""
+    manager = WebSocketConnectionManager()
+    ws = AsyncMock(spec=WebSocket)
+    ws.send_text.side_effect = WebSocketDisconnect()
+    manager.active_connections["client1"] = ws
+
+    with (
+        patch("models.logging.logger"),
+        patch("models.logging.asyncio.gather", wraps=asyncio.gather) as mock_gather,
+    ):
+        await manager.broadcast("Test message")
+
+    ws.send_text.assert_awaited_once_with("Test message")
+    assert "client1" not in manager.active_connections
+    # Only the close of the dropped socket goes through gather
+    mock_gather.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_websocketmanager_broadcast_multiple_clients():
     """Test broadcasting to multiple clients."""
@@ -277,10 +299,7 @@ async def test_websocketmanager_broadcast_multiple_clients():
     manager.active_connections["client1"] = ws1
     manager.active_connections["client2"] = ws2
 
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch("models.logging.logger"):
         await manager.broadcast("Test message")
 
     ws1.send_text.assert_called_once_with("Test message")
@@ -295,10 +314,7 @@ async def test_websocketmanager_broadcast_websocketdisconnect():
     ws.send_text.side_effect = WebSocketDisconnect()
     manager.active_connections["client1"] = ws
 
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch("models.logging.logger") as mock_logger:
         await manager.broadcast("Test message")
 
     # Client should be disconnected
@@ -314,10 +330,7 @@ async def test_websocketmanager_broadcast_runtimeerror_closed():
     ws.send_text.side_effect = RuntimeError("Connection is closed")
     manager.active_connections["client1"] = ws
 
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch("models.logging.logger") as mock_logger:
         await manager.broadcast("Test message")
 
     # Client should be disconnected
@@ -337,10 +350,7 @@ async def test_websocketmanager_broadcast_runtimeerror_other():
     ws.send_text.side_effect = RuntimeError("Some other error")
     manager.active_connections["client1"] = ws
 
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch("models.logging.logger") as mock_logger:
         await manager.broadcast("Test message")
 
     # Client should be disconnected
@@ -357,10 +367,7 @@ async def test_websocketmanager_broadcast_generic_exception():
     ws.send_text.side_effect = ValueError("Unexpected error")
     manager.active_connections["client1"] = ws
 
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
+    with patch("models.logging.logger") as mock_logger:
         await manager.broadcast("Test message")
 
     # Client should be disconnected
@@ -369,6 +376,78 @@ async def test_websocketmanager_broadcast_generic_exception():
     mock_logger.error.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_websocketmanager_broadcast_closes_dropped_sockets():
+    """Dropped clients are closed after cleanup; healthy ones are untouched."""
+    manager = WebSocketConnectionManager()
+    ok = AsyncMock(spec=WebSocket)
+    broken = AsyncMock(spec=WebSocket)
+    broken.send_text.side_effect = ValueError("Unexpected error")
+    gone = AsyncMock(spec=WebSocket)
+    gone.send_text.side_effect = WebSocketDisconnect()
+    gone.close.side_effect = RuntimeError("Already closed")
+    manager.active_connections.update({"ok": ok, "broken": broken, "gone": gone})
+
+    with patch("models.logging.logger"):
+        await manager.broadcast("Test message")
+
+    assert list(manager.active_connections) == ["ok"]
+    ok.close.assert_not_awaited()
+    broken.close.assert_awaited_once()
+    gone.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_websocketmanager_broadcast_sends_concurrently():
+    """A slow client does not hold back delivery to the others."""
+    manager = WebSocketConnectionManager()
+    slow_started = asyncio.Event()
+    release_slow = asyncio.Event()
+
+    async def slow_send(message):
+        slow_started.set()
+        await release_slow.wait()
+
+    slow = AsyncMock(spec=WebSocket)
+    slow.send_text.side_effect = slow_send
+    fast = AsyncMock(spec=WebSocket)
+    manager.active_connections.update({"slow": slow, "fast": fast})
+
+    with patch("models.logging.logger"):
+        broadcast = asyncio.create_task(manager.broadcast("Test message"))
+        await slow_started.wait()
+        await asyncio.sleep(0)
+        fast.send_text.assert_awaited_once_with("Test message")
+        release_slow.set()
+        await broadcast
+
+    assert set(manager.active_connections) == {"slow", "fast"}
+
+
+@pytest.mark.asyncio
+async def test_websocketmanager_broadcast_drops_slow_client():
+    """A client that cannot take a frame in time is dropped and closed."""
+    manager = WebSocketConnectionManager()
+
+    async def stuck_send(message):
+        await asyncio.Event().wait()
+
+    stuck = AsyncMock(spec=WebSocket)
+    stuck.send_text.side_effect = stuck_send
+    ok = AsyncMock(spec=WebSocket)
+    manager.active_connections.update({"stuck": stuck, "ok": ok})
+
+    with (
+        patch("models.logging.logger") as mock_logger,
+        patch("models.logging._WS_SEND_TIMEOUT_SECONDS", 0.01),
+    ):
+        await manager.broadcast("Test message")
+
+    assert list(manager.active_connections) == ["ok"]
+    stuck.close.assert_awaited_once()
+    mock_logger.warning.assert_called_once()
+
+
 # ==================== WebSocketLogHandler TESTS ====================
 
 
@@ -493,6 +572,61 @@ def test_websocketloghandler_emit_format_exception():
         handler.emit(record)
 
 
+def _make_record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="test.py",
+        lineno=1,
+        msg=msg,
+        args=(),
+        exc_info=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_websocketloghandler_burst_uses_single_flush_task():
+    """A burst of records is drained by one task, in order."""
+    manager = MagicMock()
+    manager.active_connections = {"client1": MagicMock()}
+    manager.broadcast = AsyncMock()
+    handler = WebSocketLogHandler(manager)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    tasks_before = len(asyncio.all_tasks())
+    for i in range(5):
+        handler.emit(_make_record(f"msg {i}"))
+    assert len(asyncio.all_tasks()) == tasks_before + 1
+
+    await asyncio.sleep(0)
+    assert manager.broadcast.await_args_list == [call(f"msg {i}") for i in range(5)]
+
+    # A later record schedules a fresh flush
+    handler.emit(_make_record("later"))
+    await asyncio.sleep(0)
+    manager.broadcast.assert_awaited_with("later")
+
+
+def test_websocketloghandler_pending_drops_oldest():
+    """Pending records are bounded; the oldest are dropped on overflow."""
+    from models.logging import _WS_LOG_PENDING_MAX
+
+    manager = MagicMock()
+    manager.active_connections = {"client1": MagicMock()}
+    handler = WebSocketLogHandler(manager)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    mock_loop = MagicMock()
+    with patch("asyncio.get_running_loop", return_value=mock_loop):
+        for i in range(_WS_LOG_PENDING_MAX + 3):
+            handler.emit(_make_record(f"msg {i}"))
+
+    mock_loop.create_task.assert_called_once()
+    mock_loop.create_task.call_args[0][0].close()
+    assert len(handler._pending) == _WS_LOG_PENDING_MAX
+    assert handler._pending[0] == "msg 3"
+
+
 # ==================== INTEGRATION TESTS ====================
 
 
@@ -503,7 +637,7 @@ async def test_websocket_logging_integration():
     ws = AsyncMock(spec=WebSocket)
 
     # Connect a client
-    with patch("logging.getLogger"):
+    with patch("models.logging.logger"):
         await manager.connect("client1", ws)
 
     # Create handler and logger